@@ -1,17 +1,24 @@
 """Script to solve Advent of Code puzzles."""
 
-import argparse
-import os
-from solutions.utils import read_input
+import sys
+from solutions.cli import run_day
 
-def solve_part1(lines):
+# Decorate with @parsed_input(version=1) from solutions.cache once parsing becomes expensive
+def parse(lines):
+    """Parse the input lines into the structure shared by both parts."""
+    parsed = lines
+    # Your parsing code here
+    return parsed
+
+
+def solve_part1(parsed):
     """Solve part 1 of the puzzle."""
     result = 0
     # Your part 2 solution code here
     return result
 
 
-def solve_part2(lines):
+def solve_part2(parsed):
     """Solve part 2 of the puzzle."""
     result = 0
     # Your part 2 solution code here
@@ -20,25 +27,7 @@ def solve_part2(lines):
 
 def main():
     """Main function to solve the puzzle."""
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Solve Advent of Code puzzle')
-    parser.add_argument('--test', action='store_true', default=False,
-                       help='Run with test input instead of real input')
-    args = parser.parse_args()
-
-    # Get day number from filename
-    day = int(os.path.basename(__file__).split('.')[0])
-
-    # Read input
-    lines = read_input(day, test=args.test)
-
-    # Solve part 1
-    part1_result = solve_part1(lines)
-    print(f"Part 1: {part1_result}")
-
-    # Solve part 2
-    part2_result = solve_part2(lines)
-    print(f"Part 2: {part2_result}")
+    run_day(sys.modules[__name__])
 
 
 if __name__ == "__main__":
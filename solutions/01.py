@@ -1,73 +1,147 @@
 """Script to solve Advent of Code puzzles."""
 
-import argparse
+import contextlib
+import itertools
 import os
-from solutions.utils import read_input
+import sys
+from solutions.cache import parsed_input
+from solutions.cli import build_parser, day_of, run_day, run_solver
+from solutions.utils import iter_lines
+
+STREAMABLE = True
+
+DEPENDENCIES = ("numpy", "heapq", "tempfile")
+
+# Number of lines sorted in memory at a time by the out-of-core mode before being spilled to disk
+RUN_SIZE = 1 << 20
 
 
 def convert_lines_to_lists(lines) -> tuple[list[int], list[int]]:
-    """Convert input lines to two lists of numbers."""
-    return [int(line.split()[0]) for line in lines], [int(line.split()[1]) for line in lines]
+    """Convert input lines to two lists of numbers, consuming the lines in a single pass."""
+    column_a, column_b = [], []
+    for line in lines:
+        a, b = line.split()
+        column_a.append(int(a))
+        column_b.append(int(b))
+    return column_a, column_b
+
 
+@parsed_input(version=2)
+def parse(lines) -> tuple["np.ndarray", "np.ndarray"]:
+    """Parse the input lines into the two location ID columns, as NumPy arrays."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
 
-def solve_part1(lines):
+    # Parse every number in one bulk pass, then split the alternating values into the two columns
+    numbers = np.fromstring(" ".join(lines), dtype=np.int64, sep=" ").reshape(-1, 2)
+    return np.ascontiguousarray(numbers[:, 0]), np.ascontiguousarray(numbers[:, 1])
+
+
+def solve_part1(columns):
     """Solve part 1 of the puzzle."""
-    result = 0
-    
-    column_a, column_b = convert_lines_to_lists(lines)
-    
-    # Sort both columns
-    column_a.sort()
-    column_b.sort()
-    
-    for i, a in enumerate(column_a):
-        result += abs(a - column_b[i])
-    
-    return result
-
-
-def solve_part2(lines):
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    # Sort both columns (np.sort returns copies, so the shared parsed input is not mutated)
+    column_a, column_b = (np.sort(column) for column in columns)
+
+    return int(np.abs(column_a - column_b).sum())
+
+
+def solve_part2(columns):
     """Solve part 2 of the puzzle."""
-    result = 0    
-    
-    column_a, column_b = convert_lines_to_lists(lines)
-    
-    # Sort both columns
-    column_a.sort()
-    column_b.sort()
-    
-    num_counts = []
-      
-    for num in column_a:
-        num_counts.append([num, column_b.count(num)])
-    
-    for num, count in num_counts:
-        result += num * count
-    
-    return result
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    column_a, column_b = columns
+    if not len(column_a) or not len(column_b):
+        return 0
+
+    # Count every distinct number of the right column, then look up each number of the left column in those counts
+    values, counts = np.unique(column_b, return_counts=True)
+    indices = np.minimum(np.searchsorted(values, column_a), len(values) - 1)
+    found = values[indices] == column_a
+
+    return int((column_a[found] * counts[indices[found]]).sum())
+
+
+def spill_sorted_runs(lines, directory: str, run_size: int = RUN_SIZE) -> tuple[list[str], list[str]]:
+    """
+    Split the input lines into runs of at most run_size lines, sort the two columns of each run and write them to
+    their own files in directory, one number per line, returning the paths of the runs of each column.
+    """
+    lines = iter(lines)
+    runs_a, runs_b = [], []
+    while run := list(itertools.islice(lines, run_size)):
+        for runs, column in zip((runs_a, runs_b), convert_lines_to_lists(run)):
+            path = os.path.join(directory, f"run-{len(runs_a) + len(runs_b)}.txt")
+            with open(path, "w") as file:
+                file.writelines(f"{number}\n" for number in sorted(column))
+            runs.append(path)
+    return runs_a, runs_b
+
+
+def merge_runs(paths: list[str], stack) -> "Iterator[int]":
+    """Lazily merge sorted run files into a single sorted stream of numbers, keeping their files open on stack."""
+    import heapq  # pylint: disable=import-outside-toplevel
+
+    files = [stack.enter_context(open(path, "r")) for path in paths]
+    return heapq.merge(*((int(line) for line in file) for file in files))
+
+
+def count_sorted(numbers) -> "Iterator[tuple[int, int]]":
+    """Collapse a sorted stream of numbers into (number, count) pairs."""
+    for number, group in itertools.groupby(numbers):
+        yield number, sum(1 for _ in group)
+
+
+def solve_out_of_core(lines, run_size: int = RUN_SIZE) -> tuple[int, int]:
+    """
+    Solve both parts of the puzzle without holding the columns in memory.
+
+    The columns are sorted with an external merge sort: sorted runs of at most run_size lines are spilled to temporary
+    files, then merged lazily. Part 1 pairs up the two merged columns, part 2 merge joins their (number, count) pairs.
+    """
+    import tempfile  # pylint: disable=import-outside-toplevel
+
+    with tempfile.TemporaryDirectory(prefix="aoc-01-") as directory:
+        runs_a, runs_b = spill_sorted_runs(lines, directory, run_size)
+
+        with contextlib.ExitStack() as stack:
+            part1 = sum(abs(a - b) for a, b in zip(merge_runs(runs_a, stack), merge_runs(runs_b, stack)))
+
+        part2 = 0
+        with contextlib.ExitStack() as stack:
+            counts_a = count_sorted(merge_runs(runs_a, stack))
+            counts_b = count_sorted(merge_runs(runs_b, stack))
+            a, count_a = next(counts_a, (None, 0))
+            b, count_b = next(counts_b, (None, 0))
+            while a is not None and b is not None:
+                if a < b:
+                    a, count_a = next(counts_a, (None, 0))
+                elif b < a:
+                    b, count_b = next(counts_b, (None, 0))
+                else:
+                    part2 += a * count_a * count_b
+                    a, count_a = next(counts_a, (None, 0))
+                    b, count_b = next(counts_b, (None, 0))
+
+    return part1, part2
 
 
 def main():
     """Main function to solve the puzzle."""
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Solve Advent of Code puzzle')
-    parser.add_argument('--test', action='store_true', default=False,
-                       help='Run with test input instead of real input')
+    module = sys.modules[__name__]
+    parser = build_parser(module)
+    parser.add_argument('--out-of-core', action='store_true', default=False,
+                       help='Sort the columns on disk in runs instead of loading them into memory')
+    parser.add_argument('--run-size', type=int, default=RUN_SIZE,
+                       help='Number of lines sorted in memory per run with --out-of-core')
     args = parser.parse_args()
 
-    # Get day number from filename
-    day = int(os.path.basename(__file__).split('.')[0])
-
-    # Read input
-    lines = read_input(day, test=args.test)
-
-    # Solve part 1
-    part1_result = solve_part1(lines)
-    print(f"Part 1: {part1_result}")
+    if not args.out_of_core:
+        run_day(module, args)
+        return
 
-    # Solve part 2
-    part2_result = solve_part2(lines)
-    print(f"Part 2: {part2_result}")
+    run_solver(module, args, "out-of-core", solve_out_of_core,
+               lambda: iter_lines(day_of(module), test=args.test, name=args.input), args.run_size)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,70 @@
 """Script to solve Advent of Code puzzles."""
 
-import argparse
-import os
-from solutions.utils import read_input
+from collections.abc import Iterator
+import itertools
+import sys
+from solutions.cache import parsed_input
+from solutions.cli import build_parser, day_of, reject_instrumented_workers, run_day, run_solver
+from solutions.utils import map_input, worker_byte_ranges
+
+STREAMABLE = True
+
+DEPENDENCIES = ("numpy",)
+
+# Number of reports packed into each matrix when parsing a lazy stream of lines
+REPORT_BATCH_SIZE = 1 << 16
+
+# Largest byte range of the input handed to a worker at once in parallel mode, to bound the memory of each worker
+CHUNK_BYTES = 64 << 20
+
+
+def convert_lines_to_reports(lines) -> list[list[int]]:
+    """Convert input lines to reports, each a list of levels."""
+    return [[int(num) for num in line.split()] for line in lines]
+
+
+def pack_reports(lines: list[str]) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Pack input lines into a matrix with a report per row, padded with zeros to the longest report, and a vector of
+    the number of levels in each report.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    text = "\n".join(lines)
+    data = np.frombuffer(text.encode(), dtype=np.uint8)
+    # A level starts wherever a non-blank character follows a blank one (or the start of the text), so the number of
+    # levels of a line is the number of starts between the end of the line before it and its own end
+    blank = data <= ord(" ")
+    starts = np.flatnonzero(~blank & np.concatenate(([True], blank[:-1])))
+    line_ends = np.append(np.flatnonzero(data == ord("\n")), len(data))
+    lengths = np.diff(np.searchsorted(starts, line_ends), prepend=0)[:len(lines)]
+
+    # Reports need at least two columns for their pairs of levels to be sliced
+    width = max(int(lengths.max(initial=0)), 2)
+    levels = np.zeros((len(lines), width), dtype=np.int64)
+    # Parse every level in one bulk pass, then scatter them to their row and column
+    levels[np.arange(width) < lengths[:, None]] = np.fromstring(text, dtype=np.int64, sep=" ")
+    return levels, lengths
+
+
+@parsed_input(version=2)
+def parse(lines) -> tuple["np.ndarray", "np.ndarray"]:
+    """Convert input lines to a padded matrix of report levels and the number of levels in each report."""
+    if isinstance(lines, Iterator):
+        # Keep lazy streams lazy so reports are processed with flat memory, a batch of reports at a time
+        batches = iter(lambda: list(itertools.islice(lines, REPORT_BATCH_SIZE)), [])
+        return (pack_reports(batch) for batch in batches)
+    return pack_reports(lines)
+
+
+def iter_batches(reports):
+    """Iterate over the packed batches of parsed reports, which are a single batch unless parsed from a stream."""
+    return (reports,) if isinstance(reports, tuple) else reports
+
 
 def determine_report_safety(report: list[int]) -> bool:
     """Determine if a report is safe."""
-    is_safe = True
+    safe = True
     abs_diff_min = 1
     abs_diff_max = 3
     is_ascending = None
@@ -21,81 +79,181 @@ def determine_report_safety(report: list[int]) -> bool:
         elif num < report[i+1]:
             is_descending = False
         if is_ascending is not None and is_ascending == is_descending:
-            is_safe = False
+            safe = False
             break
         
         diff = abs(num - report[i+1])
         if diff < abs_diff_min or diff > abs_diff_max:
-            is_safe = False
+            safe = False
             break
         if is_ascending and num > report[i+1]:
-            is_safe = False
+            safe = False
             break
         if is_descending and num < report[i+1]:
-            is_safe = False
+            safe = False
             break
-    return is_safe
+    return safe
+
+def is_gradual(diffs: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """Check which differences between levels are gradual increases and which are gradual decreases (by 1 to 3)."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    # Shifting the range to start at 0 makes anything below it wrap around to a huge unsigned number
+    return (diffs - 1).view(np.uint64) <= 2, (-1 - diffs).view(np.uint64) <= 2
+
+
+def is_safe(levels: "np.ndarray", lengths: "np.ndarray") -> "np.ndarray":
+    """Check which reports of a packed batch of reports are safe."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    # Pairs of levels past the end of a report are padding, and never make it unsafe
+    padding = np.arange(levels.shape[1] - 1) >= lengths[:, None] - 1
+    rising, falling = is_gradual(levels[:, 1:] - levels[:, :-1])
+    return (rising | padding).all(axis=1) | (falling | padding).all(axis=1)
+
+
+def count_safe(levels: "np.ndarray", lengths: "np.ndarray") -> int:
+    """Count the safe reports of a packed batch of reports."""
+    return int(is_safe(levels, lengths).sum())
+
+
+def count_safe_with_dampener(levels: "np.ndarray", lengths: "np.ndarray") -> int:
+    """
+    Count the reports of a packed batch that are safe once the Problem Dampener removes at most one level.
+
+    Removing level k leaves the pairs before level k - 1, the pairs from level k + 1 on, and the bridging pair of
+    levels k - 1 and k + 1. With running "every pair so far is fine" masks from both ends, every removal of every
+    unsafe report is checked at once.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    # Safe reports stay safe, so only the others need a level removed
+    safe = is_safe(levels, lengths)
+    levels, lengths = levels[~safe], lengths[~safe]
 
-def solve_part1(lines):
+    width = levels.shape[1]
+    columns = np.arange(width)
+    padding = columns[:-1] >= lengths[:, None] - 1
+    # The bridging pair only exists when both its levels do, the first and last level have none
+    no_bridge = columns[1:-1] + 1 >= lengths[:, None]
+    removable = columns < lengths[:, None]
+
+    dampened = np.zeros(len(levels), dtype=bool)
+    pair_checks = is_gradual(levels[:, 1:] - levels[:, :-1])
+    bridge_checks = is_gradual(levels[:, 2:] - levels[:, :-2])
+    for fine, bridge_fine in zip(pair_checks, bridge_checks):
+        fine |= padding
+        # before[:, k] is whether the pairs before level k - 1 are fine, after[:, k] whether those from level k + 1 are
+        before = np.ones((len(levels), width), dtype=bool)
+        before[:, 2:] = np.logical_and.accumulate(fine[:, :-1], axis=1)
+        after = np.ones((len(levels), width), dtype=bool)
+        after[:, :width - 2] = np.logical_and.accumulate(fine[:, :0:-1], axis=1)[:, ::-1]
+        bridge = np.ones((len(levels), width), dtype=bool)
+        bridge[:, 1:-1] = bridge_fine | no_bridge
+        dampened |= (before & after & bridge & removable).any(axis=1)
+    return int(safe.sum() + dampened.sum())
+
+
+def solve_part1(reports):
     """Solve part 1 of the puzzle."""
-    result = 0
-    
-    for line in lines:
-        report = [int(num) for num in line.split()]
-        if determine_report_safety(report):
-            result += 1
-    
-    return result
+    return sum(count_safe(*batch) for batch in iter_batches(reports))
+
+
+def find_violation(report: list[int], skip: int | None = None) -> int | None:
+    """
+    Find the index of the first level that breaks the rules together with the level after it, ignoring the level at
+    index skip, or None if the report is safe.
+    """
+    direction = 0
+    previous = None
+    for i, num in enumerate(report):
+        if i == skip:
+            continue
+        if previous is not None:
+            diff = num - report[previous]
+            # Levels must change by 1 to 3, always in the direction of the first change
+            if not 1 <= abs(diff) <= 3 or diff * direction < 0:
+                return previous
+            direction = direction or diff
+        previous = i
+    return None
+
+
+def is_safe_with_dampener(report: list[int]) -> bool:
+    """Determine if a report is safe once the Problem Dampener removes at most one level, in linear time."""
+    violation = find_violation(report)
+    if violation is None:
+        return True
+    # Every pair before the first violation is fine, so only removing one of the levels of the offending pair, or the
+    # level before it (which set the direction the pair goes against), can make the report safe
+    return any(
+        find_violation(report, skip) is None
+        for skip in (violation - 1, violation, violation + 1)
+        if skip >= 0
+    )
+
+
+def generate_sub_reports(report: list[int]) -> list[list[int]]:
+    """Generate all possible sub-reports by removing just one number from the report."""
+    sub_reports = []
+    for i in range(len(report)):
+        sub_reports.append(report[:i] + report[i+1:])
+    return sub_reports
+
 
+def is_safe_with_dampener_brute_force(report: list[int]) -> bool:
+    """Reference for is_safe_with_dampener, checking every sub-report with one level removed (quadratic time)."""
+    if determine_report_safety(report):
+        return True
+    # Since the full report is not safe, check if any of the sub-reports with just one number removed is safe
+    return any(determine_report_safety(sub_report) for sub_report in generate_sub_reports(report))
 
-def solve_part2(lines):
+
+def solve_part2(reports):
     """Solve part 2 of the puzzle."""
-    result = 0
-    
-    def generate_sub_reports(report: list[int]) -> list[list[int]]:
-        """Generate all possible sub-reports by removing just one number from the report."""
-        sub_reports = []
-        for i in range(len(report)):
-            sub_reports.append(report[:i] + report[i+1:])
-        return sub_reports
-    
-    for line in lines:
-        report = [int(num) for num in line.split()]
-        if determine_report_safety(report):
-            result += 1
-        else:
-            # Since the full report is not safe, generate all possible sub-reports by removing just one number from the report:
-            sub_reports = generate_sub_reports(report)
-            for sub_report in sub_reports:
-                # Check if any of those sub-reports are safe:
-                if determine_report_safety(sub_report):
-                    result += 1
-                    break
-    
-    return result
+    return sum(count_safe_with_dampener(*batch) for batch in iter_batches(reports))
+
+
+def count_byte_range(day: int, start: int, end: int, test: bool = False, name: str | None = None) -> tuple[int, int]:
+    """Count the safe reports of a byte range of the input for both parts, returning the two counts."""
+    with map_input(day, test, name) as view:
+        text = view[start:end].decode()
+    part1 = part2 = 0
+    for batch in parse(iter(line.strip() for line in text.splitlines())):
+        part1 += count_safe(*batch)
+        part2 += count_safe_with_dampener(*batch)
+    return part1, part2
+
+
+def solve_parallel(day: int, test: bool = False, name: str | None = None,
+                   workers: int | None = None) -> tuple[int, int]:
+    """
+    Solve both parts of the puzzle by splitting the input into newline-aligned byte ranges counted in a pool of
+    worker processes, each mapping the input file and returning only its counts.
+    """
+    import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+    workers, ranges = worker_byte_ranges(day, workers, CHUNK_BYTES, test=test, name=name)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = list(executor.map(count_byte_range, *zip(*((day, start, end, test, name) for start, end in ranges))))
+    return sum(part1 for part1, _ in counts), sum(part2 for _, part2 in counts)
 
 
 def main():
     """Main function to solve the puzzle."""
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Solve Advent of Code puzzle')
-    parser.add_argument('--test', action='store_true', default=False,
-                       help='Run with test input instead of real input')
+    module = sys.modules[__name__]
+    parser = build_parser(module)
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Count reports in byte ranges of the input in this many worker processes (0 for one per CPU)')
     args = parser.parse_args()
+    reject_instrumented_workers(parser, args)
 
-    # Get day number from filename
-    day = int(os.path.basename(__file__).split('.')[0])
-
-    # Read input
-    lines = read_input(day, test=args.test)
-
-    # Solve part 1
-    part1_result = solve_part1(lines)
-    print(f"Part 1: {part1_result}")
+    if args.workers is None:
+        run_day(module, args)
+        return
 
-    # Solve part 2
-    part2_result = solve_part2(lines)
-    print(f"Part 2: {part2_result}")
+    run_solver(module, args, "parallel", solve_parallel, day_of(module), args.test, args.input, args.workers)
 
 
 if __name__ == "__main__":
@@ -1,52 +1,175 @@
 """Script to solve Advent of Code puzzles."""
 
-import argparse
-import os
 import re
-from solutions.utils import read_input
+import sys
+from solutions.cli import build_parser, day_of, reject_instrumented_workers, run_day, run_solver
+from solutions.utils import map_input, read_chunks, worker_byte_ranges
 
-def solve_part1(lines):
+STREAMABLE = True
+
+# Largest byte range of the input handed to a worker at once in parallel mode, to bound the memory of each worker
+CHUNK_BYTES = 64 << 20
+
+# Number of bytes a worker reads past the end of its range at a time to finish an instruction straddling the end
+OVERLAP_BYTES = 256
+
+# Instructions of the corrupted memory: mul(X,Y), do() and don't()
+INSTRUCTION = re.compile(rb"mul\((\d+),(\d+)\)|do\(\)|don't\(\)")
+
+# Unfinished instructions, which may still be completed by the next chunk of memory
+INSTRUCTION_PREFIX = re.compile(rb"m(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?|d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?")
+
+
+class MemoryScanner:
+    """Scan corrupted memory chunk by chunk in a single pass, summing the multiplications of both parts."""
+
+    def __init__(self, enabled: bool | None = True):
+        # Sum of every multiplication (part 1)
+        self.part1 = 0
+        # Sum of the multiplications while enabled by do() and not disabled by don't() (part 2)
+        self.part2 = 0
+        # Whether multiplications are enabled, or None until the first do() or don't() when scanning from an unknown
+        # state (such as the middle of the memory)
+        self.enabled = enabled
+        # Sum of the multiplications before the first do() or don't() when scanning from an unknown state, which only
+        # count for part 2 if multiplications turn out to be enabled at the start
+        self.leading = 0
+        # Unfinished instruction at the end of the memory scanned so far
+        self.tail = b""
+
+    def execute(self, match: re.Match) -> None:
+        """Execute an instruction."""
+        x, y = match.groups()
+        if x is None:
+            self.enabled = match.group() == b"do()"
+            return
+        product = int(x) * int(y)
+        self.part1 += product
+        if self.enabled:
+            self.part2 += product
+        elif self.enabled is None:
+            self.leading += product
+
+    def feed(self, chunk: bytes) -> None:
+        """Scan the next chunk of memory, holding back an unfinished instruction at its end for the next chunk."""
+        memory = self.tail + chunk if self.tail else chunk
+        end = 0
+        for match in INSTRUCTION.finditer(memory):
+            self.execute(match)
+            end = match.end()
+
+        # An unfinished instruction has a single "m" or "d", at its start
+        start = max(memory.rfind(b"m", end), memory.rfind(b"d", end))
+        prefix = INSTRUCTION_PREFIX.fullmatch(memory, start) if start != -1 else None
+        self.tail = memory[start:] if prefix else b""
+
+    def finish(self, following: bytes) -> bool:
+        """
+        Try to finish the unfinished instruction with the memory following it, without scanning for any other
+        instruction, returning whether it is settled (executed or ruled out) or needs more of the following memory.
+        """
+        memory = self.tail + following
+        match = INSTRUCTION.match(memory)
+        if match:
+            self.execute(match)
+        elif INSTRUCTION_PREFIX.fullmatch(memory):
+            self.tail = memory
+            return False
+        self.tail = b""
+        return True
+
+    def scan(self, chunks) -> "MemoryScanner":
+        """Scan every chunk of memory in turn, returning the scanner itself."""
+        for chunk in chunks:
+            self.feed(chunk)
+        return self
+
+
+def parse(lines) -> tuple[int, int]:
+    """Scan the corrupted memory, with its lines joined together, returning the sums of both parts."""
+    scanner = MemoryScanner().scan(line.encode() for line in lines)
+    return scanner.part1, scanner.part2
+
+
+def scan_chunks(day: int, test: bool = False, chunk_size: int = 1 << 20, name: str | None = None) -> tuple[int, int]:
+    """Scan the raw input file in chunks of chunk_size bytes, in constant memory, returning the sums of both parts."""
+    # Lines are joined together, as by parse (though whitespace at their ends is kept rather than stripped)
+    chunks = (chunk.translate(None, b"\r\n") for chunk in read_chunks(day, test, chunk_size, name))
+    scanner = MemoryScanner().scan(chunks)
+    return scanner.part1, scanner.part2
+
+
+def scan_byte_range(day: int, start: int, end: int, test: bool = False,
+                    name: str | None = None) -> tuple[int, int, int, bool | None]:
+    """
+    Scan a byte range of the raw input file from an unknown enabled state, counting the instructions that start
+    within it. Returns the part 1 sum, the part 2 sums when starting enabled and when starting disabled, and whether
+    multiplications are enabled at its end (None if the range has no do() or don't()).
+    """
+    with map_input(day, test, name) as view:
+        scanner = MemoryScanner(enabled=None)
+        # Lines are joined together, as by scan_chunks
+        scanner.feed(view[start:end].translate(None, b"\r\n"))
+        while scanner.tail and end < len(view):
+            settled = scanner.finish(view[end:end + OVERLAP_BYTES].translate(None, b"\r\n"))
+            end += OVERLAP_BYTES
+            if settled:
+                break
+    return scanner.part1, scanner.leading + scanner.part2, scanner.part2, scanner.enabled
+
+
+def scan_parallel(day: int, test: bool = False, name: str | None = None,
+                  workers: int | None = None) -> tuple[int, int]:
+    """
+    Scan the raw input file as byte ranges in a pool of worker processes, returning the sums of both parts.
+
+    Workers don't know whether multiplications are enabled at the start of their range, so each returns its part 2
+    sum for both cases, and the ranges are then chained in order to pick the right one.
+    """
+    import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+    # Ranges needn't end on newlines, as each range scans past its end for the instructions starting within it
+    workers, ranges = worker_byte_ranges(day, workers, CHUNK_BYTES, test=test, name=name, lines=False)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(scan_byte_range, *zip(*((day, start, end, test, name) for start, end in ranges)))
+        part1 = part2 = 0
+        enabled = True
+        for range_part1, part2_if_enabled, part2_if_disabled, enabled_at_end in results:
+            part1 += range_part1
+            part2 += part2_if_enabled if enabled else part2_if_disabled
+            if enabled_at_end is not None:
+                enabled = enabled_at_end
+    return part1, part2
+
+
+def solve_part1(sums):
     """Solve part 1 of the puzzle."""
-    result = 0
-    
-    text = "".join(lines).replace('\n',' ')
-    result += sum(int(x)*int(y) for x,y in re.findall(r'mul\((\d+),(\d+)\)', text))
-    
-    return result
+    return sums[0]
 
 
-def solve_part2(lines):
+def solve_part2(sums):
     """Solve part 2 of the puzzle."""
-    result = 0
-    
-    text = "do()" + "".join(lines).replace('\n',' ') + "don't()"
-    enabled_text = "".join(re.findall(r"do\(\)(.*?)don't\(\)", text))
-    result += sum(int(x)*int(y) for x,y in re.findall(r'mul\((\d+),(\d+)\)', enabled_text))
-    
-    return result
+    return sums[1]
 
 
 def main():
     """Main function to solve the puzzle."""
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Solve Advent of Code puzzle')
-    parser.add_argument('--test', action='store_true', default=False,
-                       help='Run with test input instead of real input')
+    module = sys.modules[__name__]
+    parser = build_parser(module)
+    parser.add_argument('--chunk-size', type=int, default=None,
+                       help='Scan the raw input file in chunks of this many bytes instead of line by line')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Scan byte ranges of the raw input file in this many worker processes (0 for one per CPU)')
     args = parser.parse_args()
+    reject_instrumented_workers(parser, args)
 
-    # Get day number from filename
-    day = int(os.path.basename(__file__).split('.')[0])
-
-    # Read input
-    lines = read_input(day, test=args.test)
-
-    # Solve part 1
-    part1_result = solve_part1(lines)
-    print(f"Part 1: {part1_result}")
-
-    # Solve part 2
-    part2_result = solve_part2(lines)
-    print(f"Part 2: {part2_result}")
+    if args.workers is not None:
+        run_solver(module, args, "parallel", scan_parallel, day_of(module), args.test, args.input, args.workers)
+    elif args.chunk_size is not None:
+        run_solver(module, args, "chunks", scan_chunks, day_of(module), args.test, args.chunk_size, args.input)
+    else:
+        run_day(module, args)
 
 
 if __name__ == "__main__":
@@ -1,69 +1,67 @@
 """Script to solve Advent of Code puzzles."""
 
-import argparse
-import os
-import numpy as np
-from solutions.utils import read_input
+import sys
+from solutions.cache import parsed_input
+from solutions.cli import run_day
 
+DEPENDENCIES = ("numpy",)
 
-def get_diagonals(matrix):
-    """Get all possible diagonals from a matrix (both directions)."""
-    rows, cols = matrix.shape
-    diagonals = []
+# The eight directions a word can be spelled in, as (row, column) steps
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, -1), (1, -1), (-1, 1))
 
-    # Get all diagonals (top-left to bottom-right)
-    for offset in range(-(rows - 1), cols):
-        diagonal = np.diagonal(matrix, offset=offset)
-        if len(diagonal) >= 4:  # Only include diagonals that could contain "XMAS"
-            diagonals.append("".join(diagonal))
 
-    # Flip matrix horizontally to get diagonals in other direction
-    flipped_matrix = np.fliplr(matrix)
-    for offset in range(-(rows - 1), cols):
-        diagonal = np.diagonal(flipped_matrix, offset=offset)
-        if len(diagonal) >= 4:  # Only include diagonals that could contain "XMAS"
-            diagonals.append("".join(diagonal))
+def lines_to_matrix(lines: list[str]) -> "np.ndarray":
+    """Convert input lines to a 2D numpy array of character codes (uint8)."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
 
-    return diagonals
+    if not lines:
+        return np.zeros((0, 0), dtype=np.uint8)
+    return np.frombuffer("".join(lines).encode(), dtype=np.uint8).reshape(len(lines), -1)
 
 
-def count_xmas(line) -> int:
-    """Count instances of "XMAS" or "SAMX" in string line."""
-    return line.count("XMAS") + line.count("SAMX")
+@parsed_input(version=2)
+def parse(lines: list[str]) -> "np.ndarray":
+    """Parse the input lines into the character matrix shared by both parts."""
+    return lines_to_matrix(lines)
 
 
-def solve_part1(lines):
-    """Solve part 1 of the puzzle."""
-    result = 0
+def count_word(matrix, word: str, direction: tuple[int, int]) -> int:
+    """Count the occurrences of word spelled in a direction, comparing shifted views of the whole matrix per letter."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
 
-    # Convert input to numpy array
-    matrix = np.array([list(line) for line in lines])
+    row_step, col_step = direction
+    span = len(word) - 1
+    # Number of starting positions from which the whole word fits in the matrix
+    height = matrix.shape[0] - span * abs(row_step)
+    width = matrix.shape[1] - span * abs(col_step)
+    if height <= 0 or width <= 0:
+        return 0
 
-    # Check rows (each row is already a string)
-    for row in lines:
-        result += count_xmas(row)
+    matches = np.ones((height, width), dtype=bool)
+    for k, letter in enumerate(word.encode()):
+        # Offset of the k-th letter, shifted so that words running up or left start within the matrix too
+        row = k * row_step + span * max(-row_step, 0)
+        col = k * col_step + span * max(-col_step, 0)
+        matches &= matrix[row:row + height, col:col + width] == letter
+    return int(matches.sum())
 
-    # Check columns
-    for col in range(matrix.shape[1]):
-        column_str = "".join(matrix[:, col])
-        result += count_xmas(column_str)
 
-    # Check all possible diagonals
-    for diagonal in get_diagonals(matrix):
-        result += count_xmas(diagonal)
-
-    return result
+def solve_part1(matrix):
+    """Solve part 1 of the puzzle."""
+    return sum(count_word(matrix, "XMAS", direction) for direction in DIRECTIONS)
 
 def is_mas_x_window(window):
     """Check if a 3x3 window makes an X our of MAS, with A in the middle and MAS spelled diagonally both ways."""    
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
     def check_mas_x(matrix):
         # check if the middle of the matrix is A
-        if matrix[1, 1] != "A":
+        if matrix[1, 1] != ord("A"):
             return False
         
         # Retrieve the two diagonals from the four corners
-        mas_comparator = np.array(["M", "A", "S"])
-        sam_comparator = np.array(["S", "A", "M"])
+        mas_comparator = np.frombuffer(b"MAS", dtype=np.uint8)
+        sam_comparator = np.frombuffer(b"SAM", dtype=np.uint8)
         
         # If the first diagonal is not MAS or SAM, return False
         top_left_diagonal = np.array([matrix[0, 0], matrix[1, 1], matrix[2, 2]])
@@ -83,16 +81,13 @@ def is_mas_x_window(window):
     
     return False
 
-def solve_part2(lines):
-    """Solve part 2 of the puzzle."""
+def count_mas_x_windows(matrix) -> int:
+    """Reference for solve_part2, checking every 3x3 window of the matrix in turn."""
     result = 0
     
-    # Convert list of strings to numpy array
-    matrix = np.array([list(line) for line in lines])
-    
     # Iterate through matrix in 3x3 windows
-    for i in range(len(lines) - 2):
-        for j in range(len(lines[0]) - 2):
+    for i in range(matrix.shape[0] - 2):
+        for j in range(matrix.shape[1] - 2):
             window = matrix[i:i+3, j:j+3]
             if is_mas_x_window(window):
                 result += 1
@@ -100,31 +95,26 @@ def solve_part2(lines):
     return result
 
 
+def is_mas(start, end) -> "np.ndarray":
+    """Check where the letters at the ends of a diagonal through an A make it MAS, in either direction."""
+    m, s = ord("M"), ord("S")
+    return ((start == m) & (end == s)) | ((start == s) & (end == m))
+
+
+def solve_part2(matrix):
+    """Solve part 2 of the puzzle."""
+    # Every plane is an offset view of the whole matrix, aligned on the centres of its 3x3 windows
+    centre = matrix[1:-1, 1:-1]
+    top_left, top_right = matrix[:-2, :-2], matrix[:-2, 2:]
+    bottom_left, bottom_right = matrix[2:, :-2], matrix[2:, 2:]
+
+    mas_x = (centre == ord("A")) & is_mas(top_left, bottom_right) & is_mas(top_right, bottom_left)
+    return int(mas_x.sum())
+
+
 def main():
     """Main function to solve the puzzle."""
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description="Solve Advent of Code puzzle")
-    parser.add_argument(
-        "--test",
-        action="store_true",
-        default=False,
-        help="Run with test input instead of real input",
-    )
-    args = parser.parse_args()
-
-    # Get day number from filename
-    day = int(os.path.basename(__file__).split(".")[0])
-
-    # Read input
-    lines = read_input(day, test=args.test)
-
-    # Solve part 1
-    part1_result = solve_part1(lines)
-    print(f"Part 1: {part1_result}")
-
-    # Solve part 2
-    part2_result = solve_part2(lines)
-    print(f"Part 2: {part2_result}")
+    run_day(sys.modules[__name__])
 
 
 if __name__ == "__main__":
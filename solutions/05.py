@@ -1,17 +1,18 @@
 """Script to solve Advent of Code puzzles."""
 
-import argparse
-import os
-from solutions.utils import read_input
+import functools
+import sys
+from solutions.cache import parsed_input
+from solutions.cli import run_day
 
 class Rule:
     """A page ordering rule, defining a page number and a list of pages that must come before or after it."""
-    def __init__(self, page: int, after: set[int] = set()):
+    def __init__(self, page: int, after: set[int] | None = None):
         # Page number
         self.page = page
         
         # Page numbers that must come after this page
-        self.after_pages = after
+        self.after_pages = after if after is not None else set()
     
     @classmethod
     def from_str(cls, line: str) -> 'Rule':
@@ -33,8 +34,11 @@ class Rule:
    
 class Rules:
     """A collection of rules."""
-    def __init__(self, rules: dict[int, Rule] = {}):
-        self.rules = rules
+    def __init__(self, rules: dict[int, Rule] | None = None):
+        self.rules = rules if rules is not None else {}
+        
+        # Precedence index compiled from the rules on first use, and kept up to date as rules are upserted
+        self.index: PrecedenceIndex | None = None
     
     def upsert_rule(self, rule: Rule):
         """Add a rule to the collection, or update an existing rule."""
@@ -43,17 +47,143 @@ class Rules:
             selected_rule.after_pages.update(rule.after_pages)
         else:
             self.rules[rule.page] = rule
+        if self.index is not None:
+            self.index.add_rule(rule.page, rule.after_pages)
+    
+    def precedence_index(self) -> 'PrecedenceIndex':
+        """Get the precedence index of the rules, compiling it on first use."""
+        if self.index is None:
+            self.index = PrecedenceIndex(self)
+        return self.index
+
+class PrecedenceIndex:
+    """
+    Rules compiled into bitsets: every page gets its own bit, and every page with a rule the bits of the pages that
+    must come after it, so a set of pages is checked against a rule with a single integer operation.
+    """
+    # Bit shared by every page no rule mentions, which is never in the mask of any rule
+    UNKNOWN_BIT = 1
+    
+    def __init__(self, rules: Rules):
+        # Rules the index was compiled from, to repair updates they don't fully order as the original solution did
+        self.rules = rules
+        
+        # Bit of each page mentioned by a rule, densely numbered after the unknown bit
+        self.bits: dict[int, int] = {}
+        
+        # Bits of the pages that must come after each page with a rule, and of those that must come before each page
+        self.after_masks: dict[int, int] = {}
+        self.before_masks: dict[int, int] = {}
+        
+        for page, rule in rules.rules.items():
+            self.add_rule(page, rule.after_pages)
+    
+    def add_bit(self, page: int) -> int:
+        """Get the bit of a page, giving it the next free bit if no rule mentioned it yet."""
+        if page not in self.bits:
+            self.bits[page] = 1 << (len(self.bits) + 1)
+        return self.bits[page]
+    
+    def add_rule(self, page: int, after_pages: set[int]):
+        """Add the pages that must come after a page to the index."""
+        page_bit = self.add_bit(page)
+        mask = self.after_masks.get(page, 0)
+        for after_page in after_pages:
+            mask |= self.add_bit(after_page)
+            self.before_masks[after_page] = self.before_masks.get(after_page, 0) | page_bit
+        self.after_masks[page] = mask
+    
+    def bit(self, page: int) -> int:
+        """Get the bit of a page."""
+        return self.bits.get(page, self.UNKNOWN_BIT)
+    
+    def is_valid(self, page_updates: list[int]) -> bool:
+        """Check if a list of page updates is valid, in linear time."""
+        after_masks, bits, unknown_bit = self.after_masks, self.bits, self.UNKNOWN_BIT
+        
+        # No page with a rule may come after any page it must be before...
+        seen = 0
+        for page in page_updates:
+            after_mask = after_masks.get(page)
+            if after_mask is not None and after_mask & seen:
+                return False
+            seen |= bits.get(page, unknown_bit)
+        
+        # ...and every page after a page with a rule must be one that rule puts after it
+        later = 0
+        for page in reversed(page_updates):
+            after_mask = after_masks.get(page)
+            if after_mask is not None and later & ~after_mask:
+                return False
+            later |= bits.get(page, unknown_bit)
+        return True
+    
+    def compare(self, page: int, other_page: int) -> int:
+        """Compare two pages by the rules, for sorting: negative if page must come first, positive if other_page must."""
+        if self.after_masks.get(page, 0) & self.bit(other_page):
+            return -1
+        if self.after_masks.get(other_page, 0) & self.bit(page):
+            return 1
+        return 0
+    
+    def reorder(self, page_updates: list[int]) -> list[int]:
+        """Sort a list of page updates into the order of the rules."""
+        return sorted(page_updates, key=functools.cmp_to_key(self.compare))
+    
+    def middle_page(self, page_updates: list[int]) -> int:
+        """
+        Get the middle page of a list of page updates once put in the order of the rules.
+        
+        When the rules order every pair of its pages, the page at position i is the one that i of the other pages must
+        come before, so the middle page is found by counting those without sorting. Otherwise (including contradictory
+        rules) the update is repaired by moving pages as the original solution did, so the answer stays the same, and
+        the middle page is 0 when that repair never makes the update valid.
+        """
+        update_mask = 0
+        for page in page_updates:
+            update_mask |= self.bit(page)
+        
+        ordered = [None] * len(page_updates)
+        for page in page_updates:
+            position = (self.before_masks.get(page, 0) & update_mask).bit_count()
+            if position < len(ordered):
+                ordered[position] = page
+        
+        # Every position taken exactly once, in an order that is valid, means the rules order every pair of pages one
+        # way only
+        if None not in ordered and self.is_valid(ordered):
+            return get_middle_number(ordered)
+        repaired = repair_by_moves(self.rules, page_updates)
+        return get_middle_number(repaired) if repaired is not None else 0
     
 def parse_rules_updates(lines: list[str]) -> tuple[list[str], list[str]]:
     """Given input list of strings, split on the empty newline to return two lists of strings."""
     return lines[:lines.index('')], lines[lines.index('') + 1:]
 
+@parsed_input(version=2)
+def parse(lines: list[str]) -> tuple[Rules, list[list[int]]]:
+    """Parse the input lines into the page ordering rules and the list of page updates."""
+    raw_rules, raw_updates = parse_rules_updates(lines)
+    
+    rules = Rules()
+    
+    for rule in raw_rules:
+        rules.upsert_rule(Rule.from_str(rule))
+    
+    updates = [[int(page) for page in update.split(',')] for update in raw_updates]
+    
+    return rules, updates
+
 def get_middle_number(page_numbers: list[int]) -> int:
     """Given a list of page numbers, return the middle number, irrespective of sorting."""
     return page_numbers[len(page_numbers) // 2]
 
 def is_valid_update(rules: Rules, page_updates: list[int]) -> bool:
     """Check if a list of page updates is valid."""
+    return rules.precedence_index().is_valid(page_updates)
+
+def is_valid_update_by_rules(rules: Rules, page_updates: list[int]) -> bool:
+    """Reference for is_valid_update, checking the rule of each page against the pages before and after it."""
     for i, page in enumerate(page_updates):
         rule = rules.rules.get(page)
         # If a rule exists, verify the rule is before all subsequent pages, and NOT before any previous pages
@@ -64,19 +194,13 @@ def is_valid_update(rules: Rules, page_updates: list[int]) -> bool:
                 return False
     return True
 
-def solve_part1(lines):
+def solve_part1(parsed):
     """Solve part 1 of the puzzle."""
     result = 0
     
-    raw_rules, raw_updates = parse_rules_updates(lines)
-    
-    rules = Rules()
-    
-    for rule in raw_rules:
-        rules.upsert_rule(Rule.from_str(rule))
+    rules, updates = parsed
         
-    for update in raw_updates:
-        page_updates = [int(page) for page in update.split(',')]
+    for page_updates in updates:
         if is_valid_update(rules, page_updates):
             result += get_middle_number(page_updates)
     
@@ -116,70 +240,144 @@ def move_ints_after_index(numbers: list[int], index: int, movable_ints: list[int
     return result
 
 
-def solve_part2(lines):
+def solve_part2(parsed):
     """Solve part 2 of the puzzle."""
     result = 0
     
-    valid_updates = []
-    invalid_updates = []
+    rules, updates = parsed
+    index = rules.precedence_index()
     
-    raw_rules, raw_updates = parse_rules_updates(lines)
+    for page_updates in updates:
+        if not index.is_valid(page_updates):
+            result += index.middle_page(page_updates)
     
-    rules = Rules()
+    return result
+
+
+def repair_by_moves(rules: Rules, update: list[int]) -> list[int] | None:
+    """
+    Repair an invalid update by moving the pages before the current one that must come after it to just after it,
+    returning the repaired update, or None if it never becomes valid.
+    """
+    # With contradictory rules the moves can go round in circles, which means the update never becomes valid
+    states = set()
+    i = 0
+    while i < len(update):
+        state = (i, tuple(update))
+        if state in states:
+            return None
+        states.add(state)
+        rule = rules.rules.get(update[i])
+        if rule:
+            # Count how many elements we'll move
+            moves_count = sum(1 for x in update[:i] if x in rule.after_pages)
+            new_update = move_ints_after_index(update, i, list(rule.after_pages))
+            
+            if is_valid_update(rules, new_update):
+                return new_update
+            else:
+                update = new_update
+                # Given we moved previous elements to after the current index,
+                # we need to adjust the index accordingly
+                i = max(0, i - moves_count)
+        i += 1
+    return None
+
+
+def solve_part2_by_moves(parsed):
+    """Reference for solve_part2, repairing each invalid update by moving pages after the current one until it is valid."""
+    result = 0
     
-    for rule in raw_rules:
-        rules.upsert_rule(Rule.from_str(rule))
+    valid_updates = []
+    invalid_updates = []
+    
+    rules, updates = parsed
         
-    for update in raw_updates:
-        page_updates = [int(page) for page in update.split(',')]
+    for page_updates in updates:
         if is_valid_update(rules, page_updates):
             valid_updates.append(page_updates)
         else:
             invalid_updates.append(page_updates)
 
     for update in invalid_updates:
-        i = 0
-        while i < len(update):
-            rule = rules.rules.get(update[i])
-            if rule:
-                # Count how many elements we'll move
-                moves_count = sum(1 for x in update[:i] if x in rule.after_pages)
-                new_update = move_ints_after_index(update, i, list(rule.after_pages))
-                
-                if is_valid_update(rules, new_update):
-                    result += get_middle_number(new_update)
-                    break
-                else:
-                    update = new_update
-                    # Given we moved previous elements to after the current index,
-                    # we need to adjust the index accordingly
-                    i = max(0, i - moves_count)
-            i += 1
+        repaired = repair_by_moves(rules, update)
+        if repaired is not None:
+            result += get_middle_number(repaired)
     
     return result
 
 
-def main():
-    """Main function to solve the puzzle."""
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Solve Advent of Code puzzle')
-    parser.add_argument('--test', action='store_true', default=False,
-                       help='Run with test input instead of real input')
-    args = parser.parse_args()
-
-    # Get day number from filename
-    day = int(os.path.basename(__file__).split('.')[0])
-
-    # Read input
-    lines = read_input(day, test=args.test)
+class UpdateEvaluator:
+    """
+    Keep the answers to both parts up to date as rules and updates arrive one at a time.
+    
+    An inverted index from each page to the updates containing it limits the updates re-checked when a rule arrives to
+    those it can affect, and every update keeps its contribution to the running sums.
+    """
+    def __init__(self, rules: Rules | None = None):
+        self.rules = rules if rules is not None else Rules()
+        self.index = self.rules.precedence_index()
+        
+        self.updates: list[list[int]] = []
+        # Indices of the updates containing each page
+        self.page_updates: dict[int, set[int]] = {}
+        # Part each update counts towards (1 if valid, 2 if not) and the middle page it adds to that part's sum
+        self.contributions: list[tuple[int, int]] = []
+        
+        # Running sums of both parts
+        self.part1 = 0
+        self.part2 = 0
+    
+    def evaluate(self, update_index: int):
+        """Check an update against the current rules, replacing its previous contribution to the running sums."""
+        if update_index < len(self.contributions):
+            part, middle_page = self.contributions[update_index]
+            if part == 1:
+                self.part1 -= middle_page
+            else:
+                self.part2 -= middle_page
+        
+        page_updates = self.updates[update_index]
+        if self.index.is_valid(page_updates):
+            contribution = (1, get_middle_number(page_updates))
+            self.part1 += contribution[1]
+        else:
+            contribution = (2, self.index.middle_page(page_updates))
+            self.part2 += contribution[1]
+        
+        if update_index < len(self.contributions):
+            self.contributions[update_index] = contribution
+        else:
+            self.contributions.append(contribution)
+    
+    def add_update(self, page_updates: list[int]):
+        """Add an update, validating it against the current rules."""
+        update_index = len(self.updates)
+        self.updates.append(page_updates)
+        for page in page_updates:
+            self.page_updates.setdefault(page, set()).add(update_index)
+        self.evaluate(update_index)
+    
+    def add_rule(self, rule: Rule):
+        """Add a rule, re-checking only the updates it can affect."""
+        page_update_indices = self.page_updates.get(rule.page, set())
+        if rule.page in self.rules.rules:
+            # A rule between two pages only changes the updates containing both
+            affected = set()
+            for after_page in rule.after_pages:
+                affected |= page_update_indices & self.page_updates.get(after_page, set())
+        else:
+            # The first rule of a page constrains every page after it, in every update containing it
+            affected = page_update_indices
+        
+        self.rules.upsert_rule(rule)
+        for update_index in sorted(affected):
+            self.evaluate(update_index)
 
-    # Solve part 1
-    part1_result = solve_part1(lines)
-    print(f"Part 1: {part1_result}")
 
-    # Solve part 2
-    part2_result = solve_part2(lines)
-    print(f"Part 2: {part2_result}")
+def main():
+    """Main function to solve the puzzle."""
+    run_day(sys.modules[__name__])
 
 
 if __name__ == "__main__":
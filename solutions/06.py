@@ -1,249 +1,177 @@
 """Script to solve Advent of Code puzzles."""
 
-import argparse
-import os
-from enum import Enum
-from typing import List, Set, Tuple
-from solutions.utils import read_input
-
-
-class NodeValue(Enum):
-    """Enum for the values of the nodes."""
-
-    GUARD = "^"
-    OBSTACLE = "#"
-    OTHER = "."
-
-
-class ViewingCardinality(Enum):
-    """Enum for the cardinalities of the viewing angles."""
-
-    UP = 1
-    RIGHT = 2
-    DOWN = 3
-    LEFT = 4
-
-
-class Node:
-    """Class to represent a node in the grid."""
-
-    def __init__(self, row: int, column: int, value: NodeValue):
-        # Coordinate traveling west and east
-        self.row = row
-        # Coordinate traveling north and south
-        self.column = column
-        self.value = value
-        
-    def __str__(self) -> str:
-        """String representation of the node."""
-        return f"Node({self.row}, {self.column}, {self.value.value})"
-
-    def __repr__(self) -> str:
-        """Representation of the node."""
-        return self.__str__()
-
-    def get_next_node(
-        self, grid: List[List["Node"]], direction: ViewingCardinality
-    ) -> "Node":
-        """Get the next node in the given direction."""
-        if direction == ViewingCardinality.UP:
-            return grid[self.row - 1][self.column]
-        elif direction == ViewingCardinality.RIGHT:
-            return grid[self.row][self.column + 1]
-        elif direction == ViewingCardinality.DOWN:
-            return grid[self.row + 1][self.column]
-        elif direction == ViewingCardinality.LEFT:
-            return grid[self.row][self.column - 1]
-
-    def get_next_node_coordinates(
-        self, direction: ViewingCardinality
-    ) -> Tuple[int, int]:
-        """Get the coordinates of the next node without checking if it's in the grid."""
-        if direction == ViewingCardinality.UP:
-            return self.row - 1, self.column
-        elif direction == ViewingCardinality.RIGHT:
-            return self.row, self.column + 1
-        elif direction == ViewingCardinality.DOWN:
-            return self.row + 1, self.column
-        elif direction == ViewingCardinality.LEFT:
-            return self.row, self.column - 1
-        
-    def get_cardinality_by_current_next_nodes(self, next_node: "Node") -> ViewingCardinality:
-        """Get the cardinality of the current node based on the next node."""
-        if next_node.row < self.row:
-            return ViewingCardinality.UP
-        elif next_node.row > self.row:
-            return ViewingCardinality.DOWN
-        elif next_node.column < self.column:
-            return ViewingCardinality.LEFT
-        elif next_node.column > self.column:
-            return ViewingCardinality.RIGHT
-        raise ValueError("Next node is not adjacent to the current node.")
-    
-    @classmethod
-    def get_starting_node(cls, grid: List[List["Node"]]) -> "Node":
-        """Get the starting node from the grid."""
-        for row in grid:
-            for node in row:
-                if node.value == NodeValue.GUARD:
-                    return node
+from array import array
+import bisect
+import sys
+from solutions.cache import parsed_input
+from solutions.cli import run_day
+
+DEPENDENCIES = ("numpy",)
+
+# Directions the guard can face, in clockwise order, so turning right is adding 1 modulo 4
+UP, RIGHT, DOWN, LEFT = range(4)
+
+GUARD = ord("^")
+OBSTACLE = ord("#")
+
+
+class ObstacleIndex:
+    """
+    Sorted obstacle positions of every row and every column of the map, so the next obstacle in any direction is found
+    by bisection and the guard can be moved a whole straight segment at a time.
+
+    Cells are flat indices (row * columns + column) into the map. The obstacles of all rows are kept in a single compact
+    array of their columns, row after row, with the offset of each row's run of it, and likewise for the columns.
+    """
+
+    def __init__(self, rows: int, columns: int, obstacles: "np.ndarray"):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        self.rows = rows
+        self.columns = columns
+        # Flat indices in increasing order are sorted by row, then column
+        obstacle_rows, obstacle_columns = np.divmod(np.asarray(obstacles, dtype=np.int64), columns)
+        self.row_obstacles = array("i", obstacle_columns.astype(np.int32).tobytes())
+        self.row_offsets = array("q", np.searchsorted(obstacle_rows, np.arange(rows + 1)).tobytes())
+        # A stable sort by column keeps the rows of each column in increasing order
+        order = np.argsort(obstacle_columns, kind="stable")
+        self.column_obstacles = array("i", obstacle_rows[order].astype(np.int32).tobytes())
+        self.column_offsets = array("q", np.searchsorted(obstacle_columns[order], np.arange(columns + 1)).tobytes())
+
+    def next_stop(self, position: int, direction: int, extra_obstacle: int = -1) -> tuple[int, bool]:
+        """
+        Get the cell where a guard moving in a direction from a cell stops, and whether that is because they walk off
+        the map rather than into an obstacle, optionally with one extra obstacle on the map.
+        """
+        row, column = divmod(position, self.columns)
+        extra_row, extra_column = divmod(extra_obstacle, self.columns) if extra_obstacle >= 0 else (-1, -1)
+        if direction in (UP, DOWN):
+            obstacles, line, along, end = self.column_obstacles, column, row, self.rows
+            lo, hi = self.column_offsets[column], self.column_offsets[column + 1]
+            extra = extra_row if extra_column == column else -1
+        else:
+            obstacles, line, along, end = self.row_obstacles, row, column, self.columns
+            lo, hi = self.row_offsets[row], self.row_offsets[row + 1]
+            extra = extra_column if extra_row == row else -1
+
+        if direction in (UP, LEFT):
+            # Nearest obstacle before the guard's position, or -1 just off the map
+            i = bisect.bisect_left(obstacles, along, lo, hi)
+            blocker = obstacles[i - 1] if i > lo else -1
+            if blocker < extra < along:
+                blocker = extra
+            stop, leaves = blocker + 1, blocker == -1
+        else:
+            # Nearest obstacle after the guard's position, or end just off the map
+            i = bisect.bisect_right(obstacles, along, lo, hi)
+            blocker = obstacles[i] if i < hi else end
+            if along < extra < blocker:
+                blocker = extra
+            stop, leaves = blocker - 1, blocker == end
+
+        if direction in (UP, DOWN):
+            return stop * self.columns + line, leaves
+        return line * self.columns + stop, leaves
+
+
+def patrol(
+    index: ObstacleIndex, start: int, direction: int = UP, extra_obstacle: int = -1
+) -> tuple[list[tuple[int, int, int]], bool]:
+    """
+    Follow the guard's patrol from a cell a straight segment at a time, returning its segments (as their first and last
+    cell and direction) and whether the guard ends up in a loop rather than walking off the map.
+    """
+    position = start
+    segments = []
+    # A guard turning at the same cell in the same direction twice is in a loop. Turns are encoded as
+    # cell * 4 + direction, and only recorded at the end of a segment, so the set stays small even on large maps
+    turns = set()
+    while True:
+        stop, leaves = index.next_stop(position, direction, extra_obstacle)
+        segments.append((position, stop, direction))
+        if leaves:
+            return segments, False
+        turn = stop * 4 + direction
+        if turn in turns:
+            return segments, True
+        turns.add(turn)
+        position, direction = stop, (direction + 1) & 3
+
+
+def segment_slice(first: int, last: int, direction: int, columns: int) -> slice:
+    """Get the slice of the flat map covered by a straight segment between two cells, in increasing order."""
+    stride = columns if direction in (UP, DOWN) else 1
+    return slice(min(first, last), max(first, last) + 1, stride)
+
+
+def visited_map(index: ObstacleIndex, segments) -> "np.ndarray":
+    """Mark every cell covered by the segments of a patrol in a flat boolean map, a whole segment at a time."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    visited = np.zeros(index.rows * index.columns, dtype=bool)
+    for first, last, direction in segments:
+        visited[segment_slice(first, last, direction, index.columns)] = True
+    return visited
+
+
+class Lab:
+    """The map of the lab, as the obstacle index and the guard's starting cell."""
+
+    def __init__(self, index: ObstacleIndex, start: int):
+        self.index = index
+        self.start = start
+
+
+@parsed_input(version=3)
+def parse(lines: list[str]) -> Lab:
+    """Parse the input lines into the map of the lab shared by both parts."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    # The map is only held as one byte per cell while its obstacles are indexed
+    grid = np.frombuffer("".join(lines).encode(), dtype=np.uint8)
+    columns = len(lines[0]) if lines else 0
+    starts = np.flatnonzero(grid == GUARD)
+    if not len(starts):
         raise ValueError("No starting node found in the grid.")
+    index = ObstacleIndex(len(lines), columns, np.flatnonzero(grid == OBSTACLE))
+    return Lab(index, int(starts[0]))
 
-    @classmethod
-    def input_to_grid(cls, lines: List[str]) -> List[List["Node"]]:
-        """Convert the input lines to a grid of nodes."""
-        return [
-            [Node(x, y, NodeValue(value)) for y, value in enumerate(line)]
-            for x, line in enumerate(lines)
-        ]
-
-
-class Guard:
-    """Class to represent a guard."""
-
-    def __init__(self, starting_node: Node):
-        self.current_cardinality = ViewingCardinality.UP
-        self.current_node = starting_node
-        self.is_on_map = True
-        self.visited_nodes: List[Node] = []
-        self.unique_visited_nodes: Set[Node] = set()
-
-    def __str__(self) -> str:
-        """String representation of the guard."""
-        return f"Guard({self.current_cardinality}, {self.current_node}, {self.is_on_map}, \n{self.visited_nodes})"
-
-    def move_directionally(self, grid: List[List[Node]], starting_node: Node | None = None, starting_cardinality: ViewingCardinality | None = None) -> "Guard":
-        """Move from the current node in the given direction until an obstacle is encountered."""
-        self.visited_nodes.append(self.current_node)
-        self.unique_visited_nodes.add(self.current_node)
-        # If the next node is not in the grid, update is on map and return
-        next_node_coordinates = self.current_node.get_next_node_coordinates(
-            self.current_cardinality
-        )
-        if not 0 <= next_node_coordinates[0] < len(
-            grid
-        ) or not 0 <= next_node_coordinates[1] < len(grid[0]):
-            self.is_on_map = False
-            return self
-        next_node = self.current_node.get_next_node(grid, self.current_cardinality)
-        # If we encounter an obstacle, rotate cardinality and return
-        if grid[next_node.row][next_node.column].value == NodeValue.OBSTACLE:
-            self.rotate_current_cardinality()
-            return self
-        # Otherwise, keep moving
-        self.current_node = next_node
-        if starting_node and starting_cardinality:
-            # If we looped back to the starting node with the same cardinality, we are in a loop, and should return self
-            if self.current_node == starting_node and self.current_cardinality == starting_cardinality:
-                return self
-        
-        return self.move_directionally(grid)
-
-    def rotate_current_cardinality(self) -> None:
-        """Rotate the current cardinal direction clockwise."""
-        self.current_cardinality = ViewingCardinality(
-            (self.current_cardinality.value % 4) + 1
-        )
-        
-    def identify_possible_obstacles(self, grid: List[List[Node]]) -> Set[Node]:
-        """Identify where a single obstacle could be placed in front of a guard to force them into a loop."""
-        possible_obstacles: Set[Node] = set()
-        
-        while self.is_on_map:
-            self.move_directionally(grid)
-        
-        original_visited_nodes = self.visited_nodes.copy()
-        
-        print('Finished collecting visited nodes, and will now check for possible obstacles', self.visited_nodes)
-        
-        for index, node in enumerate(original_visited_nodes[:-1]):
-            self.visited_nodes = []
-            self.unique_visited_nodes = set()
-            
-            self.current_node = node
-            self.current_cardinality = node.get_cardinality_by_current_next_nodes(original_visited_nodes[index + 1])
-            
-            print('Checking if obstacle can be placed in front of the current node', node)
-            # Update the next node to be an obstacle 
-            original_next_node = original_visited_nodes[index + 1]
-            next_node_original_value = original_next_node.value
-            grid[original_next_node.row][original_next_node.column].value = NodeValue.OBSTACLE
-            
-            # Move the guard directionally to see if they can make it back to the starting node
-            guard = self.move_directionally(grid, starting_node=node, starting_cardinality=self.current_cardinality)
-            
-            # If the guard is still on the map then we discovered a loop, meaning the obstacle should be added to our set
-            if guard.is_on_map:
-                possible_obstacles.add(original_next_node)
-            
-            # Revert the next node to its original value 
-            grid[original_next_node.row][original_next_node.column].value = next_node_original_value
-            
-        return possible_obstacles
-            
-            
-    @property
-    def visited_nodes_count(self) -> int:
-        """Get the number of unique visited nodes."""
-        return len(self.visited_nodes)
-
-
-def solve_part1(lines):
-    """Solve part 1 of the puzzle."""
-    result = 0
-
-    grid = Node.input_to_grid(lines)
-
-    starting_node = Node.get_starting_node(grid)
-    guard = Guard(starting_node)
-
-    while guard.is_on_map:
-        guard.move_directionally(grid)
 
-    result = guard.visited_nodes_count
-
-    return result
+def solve_part1(lab):
+    """Solve part 1 of the puzzle."""
+    segments, _ = patrol(lab.index, lab.start)
+    return int(visited_map(lab.index, segments).sum())
 
 
-def solve_part2(lines):
+def solve_part2(lab):
     """Solve part 2 of the puzzle."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
     result = 0
-    
-    grid = Node.input_to_grid(lines)
+    columns = lab.index.columns
+    segments, _ = patrol(lab.index, lab.start)
+
+    # An obstacle only changes the patrol if it is on it, and only from the first time the guard would reach it, so
+    # each candidate is checked by restarting the patrol from the cell before that, facing it
+    visited = np.zeros(lab.index.rows * columns, dtype=bool)
+    visited[lab.start] = True
+    for first, last, direction in segments:
+        cells = visited[segment_slice(first, last, direction, columns)]
+        # Cells of the segment in walking order, and the step between them in the flat map
+        backwards = direction in (UP, LEFT)
+        step = (columns if direction in (UP, DOWN) else 1) * (-1 if backwards else 1)
+        for offset in np.flatnonzero(~(cells[::-1] if backwards else cells)):
+            obstacle = first + step * int(offset)
+            _, loops = patrol(lab.index, obstacle - step, direction, extra_obstacle=obstacle)
+            result += loops
+        cells[:] = True
 
-    starting_node = Node.get_starting_node(grid)
-    guard = Guard(starting_node)
-    
-    result = guard.identify_possible_obstacles(grid)
-    
-    return len(result)
+    return result
 
 
 def main():
     """Main function to solve the puzzle."""
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description="Solve Advent of Code puzzle")
-    parser.add_argument(
-        "--test",
-        action="store_true",
-        default=False,
-        help="Run with test input instead of real input",
-    )
-    args = parser.parse_args()
-
-    # Get day number from filename
-    day = int(os.path.basename(__file__).split(".")[0])
-
-    # Read input
-    lines = read_input(day, test=args.test)
-
-    # Solve part 1
-    part1_result = solve_part1(lines)
-    print(f"Part 1: {part1_result}")
-
-    # Solve part 2
-    part2_result = solve_part2(lines)
-    print(f"Part 2: {part2_result}")
+    run_day(sys.modules[__name__])
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
 """Script to solve Advent of Code puzzles."""
 
-import argparse
 from enum import Enum
-import os
-from solutions.utils import read_input
+from collections.abc import Iterator
+import sys
+from solutions.cache import parsed_input
+from solutions.cli import run_day
+
+STREAMABLE = True
 
 class Equation:
     """Simple representation of the components of an equation, minus the operators."""
@@ -19,6 +22,13 @@ class Equation:
         variables = [int(variable) for variable in equation.split()]
         return Equation(line, int(result), variables)
     
+@parsed_input(version=1)
+def parse(lines: list[str]) -> list[Equation]:
+    """Create an Equation from every line of input."""
+    equations = (Equation.from_line(line) for line in lines)
+    # Keep lazy streams lazy so equations are processed with flat memory
+    return equations if isinstance(lines, Iterator) else list(equations)
+
 class Operations(Enum):
     """Simple representation of the operations that can be performed on an equation."""
     ADD = '+'
@@ -59,10 +69,9 @@ def try_operations(variables: list[int], target: int, current_value: int = None,
             
     return None
 
-def solve_part1(lines):
+def solve_part1(equations):
     """Solve part 1 of the puzzle."""
     result = 0
-    equations = [Equation.from_line(line) for line in lines]
     
     for equation in equations:
         print("Attempting to solve equation", equation.equation)
@@ -77,7 +86,7 @@ def solve_part1(lines):
     return result
 
 
-def solve_part2(lines):
+def solve_part2(equations):
     """Solve part 2 of the puzzle."""
     result = 0
     # Your part 2 solution code here
@@ -86,25 +95,7 @@ def solve_part2(lines):
 
 def main():
     """Main function to solve the puzzle."""
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Solve Advent of Code puzzle')
-    parser.add_argument('--test', action='store_true', default=False,
-                       help='Run with test input instead of real input')
-    args = parser.parse_args()
-
-    # Get day number from filename
-    day = int(os.path.basename(__file__).split('.')[0])
-
-    # Read input
-    lines = read_input(day, test=args.test)
-
-    # Solve part 1
-    part1_result = solve_part1(lines)
-    print(f"Part 1: {part1_result}")
-
-    # Solve part 2
-    part2_result = solve_part2(lines)
-    print(f"Part 2: {part2_result}")
+    run_day(sys.modules[__name__])
 
 
 if __name__ == "__main__":
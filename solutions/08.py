@@ -1,8 +1,8 @@
 """Script to solve Advent of Code puzzles."""
 
-import argparse
-import os
-from solutions.utils import read_input
+import sys
+from solutions.cache import parsed_input
+from solutions.cli import run_day
 
 
 class Antinode:
@@ -30,6 +30,22 @@ class Antenna:
     def __repr__(self):
         return f"Antenna(column={self.column}, row={self.row}, frequency={self.frequency})"
 
+def parse_antennas(lines: list[str]) -> list[Antenna]:
+    """Find every antenna in the input lines."""
+    antennas = []
+    
+    for row, line in enumerate(lines):
+        for column, frequency in enumerate(line):
+            if frequency != '.':
+                antennas.append(Antenna(column, row, frequency))
+    
+    return antennas
+
+@parsed_input(version=1)
+def parse(lines: list[str]) -> tuple[list[Antenna], int, int]:
+    """Parse the input lines into the antennas, and the row and column counts of the grid."""
+    return parse_antennas(lines), len(lines), len(lines[0])
+
 def calculate_antinodes(antenna_1: Antenna, antenna_2: Antenna) -> tuple[Antinode, Antinode]:
     row_diff = antenna_1.row - antenna_2.row
     column_diff = antenna_1.column - antenna_2.column
@@ -53,16 +69,11 @@ def calculate_antinodes(antenna_1: Antenna, antenna_2: Antenna) -> tuple[Antinod
     
     return (antinode_1, antinode_2)
 
-def solve_part1(lines):
+def solve_part1(parsed):
     """Solve part 1 of the puzzle."""
     result = 0
     
-    antennas = []
-    
-    for row, line in enumerate(lines):
-        for column, frequency in enumerate(line):
-            if frequency != '.':
-                antennas.append(Antenna(column, row, frequency))
+    antennas, row_count, column_count = parsed
     
     antinodes = set()
     
@@ -73,9 +84,6 @@ def solve_part1(lines):
                 antinodes.add(antinode_1)
                 antinodes.add(antinode_2)
     
-    row_count = len(lines)
-    column_count = len(lines[0])
-    
     # For each antinode whose column and row are within our grid, add 1 to the result
     for antinode in antinodes:
         if 0 <= antinode.column < column_count and 0 <= antinode.row < row_count:
@@ -112,22 +120,14 @@ def calculate_antinodes_considering_harmonic_frequencies(antenna_1: Antenna, ant
     return antinodes
 
 
-def solve_part2(lines):
+def solve_part2(parsed):
     """Solve part 2 of the puzzle."""
     result = 0
     
-    antennas = []
-    
-    for row, line in enumerate(lines):
-        for column, frequency in enumerate(line):
-            if frequency != '.':
-                antennas.append(Antenna(column, row, frequency))
+    antennas, row_count, column_count = parsed
     
     antinodes = set()
     
-    row_count = len(lines)
-    column_count = len(lines[0])
-    
     for i, antenna in enumerate(antennas):
         for antenna_2 in antennas[i+1:]:
             if antenna.frequency == antenna_2.frequency:
@@ -144,25 +144,7 @@ def solve_part2(lines):
 
 def main():
     """Main function to solve the puzzle."""
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Solve Advent of Code puzzle')
-    parser.add_argument('--test', action='store_true', default=False,
-                       help='Run with test input instead of real input')
-    args = parser.parse_args()
-
-    # Get day number from filename
-    day = int(os.path.basename(__file__).split('.')[0])
-
-    # Read input
-    lines = read_input(day, test=args.test)
-
-    # Solve part 1
-    part1_result = solve_part1(lines)
-    print(f"Part 1: {part1_result}")
-
-    # Solve part 2
-    part2_result = solve_part2(lines)
-    print(f"Part 2: {part2_result}")
+    run_day(sys.modules[__name__])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+"""Run and benchmark any subset of days in a single process."""
+
+import argparse
+import json
+import sys
+from solutions import cache
+from solutions.runner import LOAD, PARSE, PARTS, discover_days, format_json, format_table, run_days, run_days_parallel
+
+
+def main():
+    """Main function to run several days of Advent of Code puzzles."""
+    parser = argparse.ArgumentParser(description='Run and benchmark Advent of Code solutions')
+    parser.add_argument('days', type=int, nargs='*',
+                       help='Day numbers to run (default: every solutions/NN.py module)')
+    parser.add_argument('--part', type=int, choices=PARTS, action='append',
+                       help='Only run the given part (may be repeated)')
+    parser.add_argument('--test', action='store_true', default=False,
+                       help='Run with test input instead of real input')
+    parser.add_argument('--input', default=None,
+                       help='Run with this file from each inputs/NN directory instead, e.g. a generated input')
+    parser.add_argument('--repeat', type=int, default=1,
+                       help='Number of timed runs per part')
+    parser.add_argument('--json', action='store_true', default=False,
+                       help='Emit results as JSON instead of a table')
+    parser.add_argument('--stream', action='store_true', default=False,
+                       help='Stream input lines from disk for days that support it')
+    parser.add_argument('--no-cache', action='store_true', default=False,
+                       help='Parse input from scratch instead of using the on-disk parsed-input cache')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Run (day, part) jobs in a pool of this many worker processes (0 for one per CPU)')
+    parser.add_argument('--profile', action='store_true', default=False,
+                       help='Profile one extra run of each part with cProfile and report its hottest functions')
+    parser.add_argument('--profile-top', type=int, default=20,
+                       help='Number of functions to list per profile report')
+    parser.add_argument('--profile-dir', default=None,
+                       help='Also dump a .prof file per part into this directory')
+    parser.add_argument('--mem', action='store_true', default=False,
+                       help='Trace one extra run of each parse stage and part with tracemalloc and report memory use')
+    parser.add_argument('--mem-top', type=int, default=10,
+                       help='Number of allocation sites to list per memory report')
+    parser.add_argument('--startup', action='store_true', default=False,
+                       help='Measure the import time of each day in fresh interpreters against its budget instead, '
+                            'exiting with an error if any day is over budget')
+    parser.add_argument('--scale', action='store_true', default=False,
+                       help='Measure how time and memory grow on generated inputs of increasing size instead')
+    parser.add_argument('--scale-start', type=int, default=None,
+                       help='Size of the first generated input (default: a per-day starting size)')
+    parser.add_argument('--scale-factor', type=int, default=2,
+                       help='Factor the generated input size grows by at each step')
+    parser.add_argument('--scale-steps', type=int, default=6,
+                       help='Number of input sizes to measure')
+    parser.add_argument('--scale-budget', type=float, default=10.0,
+                       help='Stop growing a stage once a single run of it takes longer than this many seconds')
+    parser.add_argument('--scale-grow', metavar='OPTION', default=None,
+                       help="Grow this generator option (such as day 05's max_pages) from --scale-start instead of "
+                            "the input size")
+    args = parser.parse_args()
+    if args.scale_grow and not args.scale_start:
+        parser.error("--scale-grow needs --scale-start")
+
+    if args.no_cache:
+        cache.set_enabled(False)
+
+    days = args.days or discover_days()
+    parts = tuple(args.part) if args.part else PARTS
+
+    repeat = max(1, args.repeat)
+    if args.startup:
+        from solutions.startup import check_startup, format_startup_report  # pylint: disable=import-outside-toplevel
+
+        results = list(check_startup(days, repeat=repeat))
+        print(json.dumps(results, indent=2) if args.json else format_startup_report(results))
+        if not all(result["within_budget"] for result in results):
+            sys.exit(1)
+        return
+
+    if args.scale:
+        # Imported here as it pulls in every generator, which plain runs don't need
+        from solutions.scaling import (  # pylint: disable=import-outside-toplevel
+            format_scaling_json, format_scaling_report, run_scaling,
+        )
+
+        results = list(run_scaling(days, parts, start=args.scale_start, factor=args.scale_factor,
+                                   steps=args.scale_steps, repeat=repeat, time_budget=args.scale_budget,
+                                   grow=args.scale_grow))
+        print(format_scaling_json(results) if args.json else format_scaling_report(results))
+        return
+
+    profiler = tracer = None
+    if args.profile:
+        from solutions.profiling import Profiler  # pylint: disable=import-outside-toplevel
+
+        profiler = Profiler(top=args.profile_top, dump_dir=args.profile_dir)
+    if args.mem:
+        from solutions.memory import MemoryTracer  # pylint: disable=import-outside-toplevel
+
+        tracer = MemoryTracer(top=args.mem_top)
+    if args.workers is None:
+        results = list(run_days(days, parts, test=args.test, repeat=repeat, stream=args.stream,
+                                profiler=profiler, tracer=tracer, input_name=args.input))
+    else:
+        # Results come back in completion order
+        results = list(run_days_parallel(days, parts, test=args.test, repeat=repeat, stream=args.stream,
+                                         workers=args.workers or None, profiler=profiler, tracer=tracer,
+                                         input_name=args.input))
+
+    if args.json:
+        print(format_json(results))
+    else:
+        print(format_table(results))
+        for result in results:
+            label = f"{result.day:02d}-{result.part if result.part in (PARSE, LOAD) else f'part{result.part}'}"
+            if result.memory:
+                from solutions.memory import format_memory_report  # pylint: disable=import-outside-toplevel
+
+                print(f"\n{format_memory_report(label, result.memory)}")
+            if result.profile:
+                print(f"\n{result.profile}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark optimised solution paths against the reference implementations they replaced, on generated inputs.
+
+Each benchmark times every path on the same input (keeping the fastest of repeat runs), checks that they all agree on
+the answer, and reports the speedup over the reference, which is always the first path listed.
+"""
+
+import argparse
+import random
+from solutions import cache
+from solutions.generators import generate, generate_02
+from solutions.runner import load_day, time_call
+
+
+def compare(paths: dict, repeat: int = 3, time_budget: float = 10.0) -> list[dict]:
+    """
+    Time each path, given as a function and the argument to call it with, returning a dict per path with its answer
+    and fastest time in seconds. A path is run repeat times, or fewer once its runs took over time_budget seconds.
+    """
+    rows = []
+    for name, (func, argument) in paths.items():
+        answer, wall, _ = time_call(func, argument)
+        elapsed = wall
+        for _ in range(repeat - 1):
+            if elapsed > time_budget:
+                break
+            run_wall = time_call(func, argument)[1]
+            elapsed += run_wall
+            wall = min(wall, run_wall)
+        rows.append({"path": name, "answer": answer, "time": wall})
+    return rows
+
+
+def benchmark_dampener(repeat: int = 3, seed: int = 0, total_levels: int = 50000):
+    """
+    Compare the linear and the vectorized Problem Dampener checks of day 02 against the brute-force one, on reports
+    of growing length (about total_levels levels in all per case), yielding a case label and its rows.
+    """
+    module = load_day(2)
+    for levels in (8, 64, 512):
+        lines = generate_02(max(total_levels // levels, 1), random.Random(f"dampener:{levels}:{seed}"),
+                            min_levels=levels, max_levels=levels)
+        reports = module.convert_lines_to_reports(lines)
+        paths = {
+            "brute force": (lambda reports: sum(map(module.is_safe_with_dampener_brute_force, reports)), reports),
+            "linear": (lambda reports: sum(map(module.is_safe_with_dampener, reports)), reports),
+            "vectorized": (module.solve_part2, module.parse(lines)),
+        }
+        yield f"{len(lines)} reports of {levels} levels", compare(paths, repeat)
+
+
+def benchmark_xmas(repeat: int = 3, seed: int = 0, sizes: tuple[int, ...] = (500, 5000)):
+    """
+    Compare the mask-based X-MAS count of day 04 part 2 against the loop over every 3x3 window, on generated grids
+    of the given side lengths, yielding a case label and its rows.
+    """
+    module = load_day(4)
+    for size in sizes:
+        matrix = module.parse(generate(4, size, seed))
+        paths = {
+            "windows": (module.count_mas_x_windows, matrix),
+            "masks": (module.solve_part2, matrix),
+        }
+        yield f"{size}x{size} grid", compare(paths, repeat)
+
+
+def benchmark_reorder(repeat: int = 3, seed: int = 0, sizes: tuple[int, ...] = (1000, 10000)):
+    """
+    Compare reordering the invalid updates of day 05 part 2 by sorting, and by predecessor counts, against the loop
+    moving pages until the update is valid, on generated inputs of the given numbers of updates, yielding a case label
+    and its rows.
+    """
+    module = load_day(5)
+    for size in sizes:
+        parsed = module.parse(generate(5, size, seed))
+        index = parsed[0].precedence_index()
+        paths = {
+            "moves": (module.solve_part2_by_moves, parsed),
+            # The index is bound as a default, so the path doesn't depend on the loop variable
+            "sort": (lambda updates, index=index: sum(module.get_middle_number(index.reorder(update))
+                                                      for update in updates if not index.is_valid(update)), parsed[1]),
+            "predecessors": (module.solve_part2, parsed),
+        }
+        yield f"{size} updates", compare(paths, repeat)
+
+
+def benchmark_wordsearch(repeat: int = 3, seed: int = 0, size: int = 200,
+                         dictionary_sizes: tuple[int, ...] = (10, 100, 1000, 5000)):
+    """
+    Compare the Aho–Corasick word search against scanning a generated day 04 grid of the given side length once per
+    word (as day 04 part 1 does for XMAS), for dictionaries of growing size, yielding a case label and its rows.
+    """
+    from solutions.wordsearch import WordSearch  # pylint: disable=import-outside-toplevel
+
+    module = load_day(4)
+    lines = generate(4, size, seed)
+    matrix = module.parse(lines)
+    rng = random.Random(f"wordsearch:{seed}")
+    for dictionary_size in dictionary_sizes:
+        # Palindromes are left out, as scanning per word finds them twice, once in each direction
+        words = set()
+        while len(words) < dictionary_size:
+            word = "".join(rng.choice("XMAS") for _ in range(rng.randint(4, 8)))
+            if word != word[::-1]:
+                words.add(word)
+        paths = {
+            "per word": (lambda words: sum(module.count_word(matrix, word, direction)
+                                           for word in words for direction in module.DIRECTIONS), words),
+            "automaton": (lambda words: sum(WordSearch(words).count(lines).values()), words),
+        }
+        yield f"{dictionary_size} words in a {size}x{size} grid", compare(paths, repeat)
+
+
+BENCHMARKS = {
+    "dampener": benchmark_dampener,
+    "reorder": benchmark_reorder,
+    "wordsearch": benchmark_wordsearch,
+    "xmas": benchmark_xmas,
+}
+
+
+def format_comparison(label: str, rows: list[dict]) -> str:
+    """Format the rows of one benchmark case as a plain text table, with speedups over the first (reference) path."""
+    reference = rows[0]
+    lines = [f"== {label}", f"{'path':<16}  {'answer':<16}  {'time ms':>10}  {'speedup':>8}"]
+    for row in rows:
+        speedup = reference["time"] / row["time"] if row["time"] else float("inf")
+        flag = "" if row["answer"] == reference["answer"] else "  MISMATCH"
+        lines.append(f"{row['path']:<16}  {str(row['answer']):<16}  {row['time'] * 1000:>10.3f}  {speedup:>7.1f}x{flag}")
+    return "\n".join(lines)
+
+
+def main():
+    """Main function to run benchmarks."""
+    parser = argparse.ArgumentParser(description='Benchmark optimised solution paths against their references')
+    parser.add_argument('benchmarks', nargs='*', metavar='NAME',
+                       help=f'Benchmarks to run (default: all of them): {", ".join(sorted(BENCHMARKS))}')
+    parser.add_argument('--repeat', type=int, default=3,
+                       help='Number of timed runs of each path, keeping the fastest')
+    parser.add_argument('--seed', type=int, default=0,
+                       help='Seed for the generated inputs')
+    args = parser.parse_args()
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark {name!r} (choose from {', '.join(sorted(BENCHMARKS))})")
+
+    mismatch = False
+    with cache.disabled():
+        for name in args.benchmarks or sorted(BENCHMARKS):
+            for label, rows in BENCHMARKS[name](repeat=args.repeat, seed=args.seed):
+                print(format_comparison(label, rows))
+                mismatch |= any(row["answer"] != rows[0]["answer"] for row in rows)
+    if mismatch:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+On-disk cache of parsed puzzle input.
+
+Parsers decorated with `parsed_input` store their result under a key derived from the SHA-256 of the input lines,
+the parser (module, day and qualified name) and its version, so a warm run loads the parsed structure instead of
+parsing again. Bump the version whenever a parser's output changes shape.
+
+NumPy arrays (or tuples of them) are stored as `.npz`, anything else is pickled. The cache is kept under a size cap,
+evicting the least recently used entries first.
+
+Every day module imports this, so its heavier dependencies are only imported once the cache is actually used.
+"""
+
+import contextlib
+import functools
+import os
+import sys
+
+CACHE_DIR = os.environ.get("AOC_CACHE_DIR", os.path.join(".cache", "parsed"))
+MAX_CACHE_BYTES = int(os.environ.get("AOC_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+_enabled = os.environ.get("AOC_CACHE", "1") != "0"
+
+# Modules imported by a cached parser on first use, which are imported up front before timing or tracing one
+DEPENDENCIES = ("hashlib", "pickle", "tempfile")
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn the parsed-input cache on or off for this process."""
+    global _enabled  # pylint: disable=global-statement
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """Check if the parsed-input cache is turned on."""
+    return _enabled
+
+
+@contextlib.contextmanager
+def disabled():
+    """
+    Turn the parsed-input cache off within a with block, as when parsing generated inputs: every one is new, so
+    caching its parse would only fill the cache.
+    """
+    was_enabled = _enabled
+    set_enabled(False)
+    try:
+        yield
+    finally:
+        set_enabled(was_enabled)
+
+
+def input_digest(lines: list[str], prefix: str = "") -> str:
+    """SHA-256 of the input lines, optionally preceded by a prefix."""
+    import hashlib  # pylint: disable=import-outside-toplevel
+
+    digest = hashlib.sha256(prefix.encode())
+    digest.update("\n".join(lines).encode())
+    return digest.hexdigest()
+
+
+def is_numpy_value(value) -> bool:
+    """Check if a value is a NumPy array, or a non-empty tuple of them, and so can be stored as .npz."""
+    values = value if isinstance(value, tuple) and value else (value,)
+    return all(type(item).__module__ == "numpy" and type(item).__name__ == "ndarray" for item in values)
+
+
+def save_entry(path: str, value) -> str:
+    """Atomically write a value to path (without extension), returning the path of the written file."""
+    import pickle  # pylint: disable=import-outside-toplevel
+    import tempfile  # pylint: disable=import-outside-toplevel
+
+    if is_numpy_value(value):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        path += ".npz"
+        arrays = value if isinstance(value, tuple) else (value,)
+        payload = {f"arr_{i}": array for i, array in enumerate(arrays)}
+        payload["is_tuple"] = np.array(isinstance(value, tuple))
+        writer = lambda file: np.savez(file, **payload)
+    else:
+        path += ".pkl"
+        writer = lambda file: pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            writer(file)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return path
+
+
+def load_entry(path: str) -> tuple[bool, object]:
+    """Load a value stored at path (without extension), returning whether it was found and the value."""
+    if os.path.exists(path + ".npz"):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        path += ".npz"
+        with np.load(path, allow_pickle=False) as data:
+            arrays = tuple(data[f"arr_{i}"] for i in range(len(data.files) - 1))
+            value = arrays if bool(data["is_tuple"]) else arrays[0]
+    elif os.path.exists(path + ".pkl"):
+        import pickle  # pylint: disable=import-outside-toplevel
+
+        path += ".pkl"
+        with open(path, "rb") as file:
+            value = pickle.load(file)
+    else:
+        return False, None
+
+    # Mark the entry as recently used for eviction
+    os.utime(path)
+    return True, value
+
+
+def evict(max_bytes: int = MAX_CACHE_BYTES) -> None:
+    """Remove the least recently used entries until the cache fits within max_bytes."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    entries = []
+    for entry in os.scandir(CACHE_DIR):
+        if entry.is_file() and not entry.name.endswith(".tmp"):
+            # Another process may evict the same entries at the same time
+            with contextlib.suppress(FileNotFoundError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+        total -= size
+
+
+def clear() -> None:
+    """Remove every entry from the cache."""
+    evict(max_bytes=0)
+
+
+def uncached(parser):
+    """Get the undecorated parser behind a parser decorated with parsed_input, or the parser itself otherwise."""
+    return getattr(parser, "uncached", parser)
+
+
+def is_cached(parser) -> bool:
+    """Check if a parser is decorated with parsed_input."""
+    return uncached(parser) is not parser
+
+
+def parsed_input(version: int = 1):
+    """
+    Decorate a parser taking input lines as its last argument so its result is cached on disk.
+
+    Inputs that are not a list or tuple of lines (such as lazy streams) are always parsed directly. The undecorated
+    parser stays available as the uncached attribute of the decorated one, to time parsing itself.
+    """
+    def decorator(parser):
+        module_name = parser.__module__
+        module_file = getattr(sys.modules.get(module_name), "__file__", None) or module_name
+        day = os.path.splitext(os.path.basename(module_file))[0]
+        name = f"{module_name}:{day}:{parser.__qualname__}:v{version}"
+
+        @functools.wraps(parser)
+        def wrapper(*args):
+            lines = args[-1]
+            if not _enabled or not isinstance(lines, (list, tuple)):
+                return parser(*args)
+
+            key = input_digest(lines, prefix=f"{name}:")
+            path = os.path.join(CACHE_DIR, f"{day}-{parser.__name__}-{key[:32]}")
+            try:
+                found, value = load_entry(path)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # A corrupt or incompatible entry is treated as a miss and overwritten
+                found, value = False, None
+            if found:
+                return value
+
+            value = parser(*args)
+            try:
+                save_entry(path, value)
+                evict()
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Failing to store the entry or trim the cache only loses caching, never the parse
+                pass
+            return value
+
+        wrapper.uncached = parser
+        return wrapper
+
+    return decorator
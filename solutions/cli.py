@@ -0,0 +1,139 @@
+"""
+Shared command line entry point of the day modules.
+
+Everything beyond reading input is imported on demand, so running a day (or importing it into the runner) only pays
+for what it uses: argparse when run as a script, cProfile with --profile, tracemalloc with --mem.
+
+A day module sets STREAMABLE = True when its parse consumes its lines exactly once, so it can be fed a lazy stream of
+lines instead of a list (which enables --stream here and in the runner). It lists the modules it only imports where
+they're used (such as numpy) in DEPENDENCIES, which import_dependencies imports up front before a day is timed,
+profiled or traced, so no measurement includes an import.
+"""
+
+import os
+from solutions import cache
+from solutions.utils import iter_lines, read_input
+
+
+def day_of(module) -> int:
+    """Get the day number of a day module from its file name."""
+    return int(os.path.basename(module.__file__).split('.')[0])
+
+
+def import_dependencies(module) -> None:
+    """
+    Import the modules a day module only imports where they're used (its DEPENDENCIES, and those of the parsed-input
+    cache for a cached parser), so that timing, profiling or tracing its first call doesn't measure their import.
+    """
+    import importlib  # pylint: disable=import-outside-toplevel
+
+    names = getattr(module, "DEPENDENCIES", ())
+    if cache.is_enabled() and cache.is_cached(getattr(module, "parse", None)):
+        names += cache.DEPENDENCIES
+    for name in names:
+        importlib.import_module(name)
+
+
+def build_parser(module):
+    """Build the argument parser of a day module, for modules that need to add options of their own."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(description='Solve Advent of Code puzzle')
+    parser.add_argument('--test', action='store_true', default=False,
+                       help='Run with test input instead of real input')
+    parser.add_argument('--input', default=None,
+                       help='Run with this file from the inputs directory of the day instead, e.g. a generated input')
+    if getattr(module, 'STREAMABLE', False):
+        parser.add_argument('--stream', action='store_true', default=False,
+                           help='Stream input lines from disk instead of reading the whole file up front')
+    parser.add_argument('--profile', action='store_true', default=False,
+                       help='Profile each part with cProfile and print its hottest functions')
+    parser.add_argument('--profile-top', type=int, default=20,
+                       help='Number of functions to list per profile report')
+    parser.add_argument('--profile-dir', default=None,
+                       help='Also dump a .prof file per part into this directory')
+    parser.add_argument('--mem', action='store_true', default=False,
+                       help='Trace the parse stage and each part with tracemalloc and report their memory use')
+    parser.add_argument('--mem-top', type=int, default=10,
+                       help='Number of allocation sites to list per memory report')
+    return parser
+
+
+def instrument(func, args, label: str, profile: bool = True):
+    """
+    Wrap func in the profiler and memory tracer requested on the command line, if any.
+
+    With both, func is run once under each, so neither measures the other. As in the runner, an argument that is a
+    callable is called for a fresh argument on each run, for inputs (such as lazy streams) that a run consumes.
+    """
+    profiler = tracer = None
+    if profile and args.profile:
+        from solutions.profiling import Profiler  # pylint: disable=import-outside-toplevel
+
+        profiler = Profiler(top=args.profile_top, dump_dir=args.profile_dir)
+    if args.mem:
+        from solutions.memory import MemoryTracer  # pylint: disable=import-outside-toplevel
+
+        tracer = MemoryTracer(top=args.mem_top)
+
+    def instrumented(*func_args):
+        fresh_args = lambda: [arg() if callable(arg) else arg for arg in func_args]
+        if profiler:
+            result, report = profiler.run(label, func, *fresh_args())
+            print(report)
+            if not tracer:
+                return result
+        if not tracer:
+            return func(*fresh_args())
+        from solutions.memory import format_memory_report  # pylint: disable=import-outside-toplevel
+
+        result, report = tracer.run(func, *fresh_args())
+        print(format_memory_report(label, report))
+        return result
+
+    return instrumented
+
+
+def run_solver(module, args, name: str, func, *func_args):
+    """
+    Solve both parts at once with a day module's alternative solver (such as an out-of-core or chunked one), under the
+    profiler and memory tracer requested on the command line, printing the answer to both parts.
+    """
+    if args.profile or args.mem:
+        import_dependencies(module)
+    part1_result, part2_result = instrument(func, args, f"{day_of(module):02d}-{name}")(*func_args)
+    print(f"Part 1: {part1_result}")
+    print(f"Part 2: {part2_result}")
+
+
+def reject_instrumented_workers(parser, args) -> None:
+    """Reject --profile and --mem with --workers, as they would only see this process waiting for its workers."""
+    if args.workers is not None and (args.profile or args.mem):
+        parser.error("--profile and --mem can't be combined with --workers, which solves in other processes")
+
+
+def run_day(module, args=None):
+    """Main function to solve the puzzle of a day module, printing the answer to both parts."""
+    if args is None:
+        args = build_parser(module).parse_args()
+
+    day = day_of(module)
+    if args.profile or args.mem:
+        import_dependencies(module)
+
+    # Read and parse input, either once and shared by both parts or as a fresh lazy stream for each run of a part
+    if getattr(args, 'stream', False):
+        part1_input = part2_input = lambda: module.parse(iter_lines(day, test=args.test, name=args.input))
+    else:
+        lines = read_input(day, test=args.test, name=args.input)
+        # Traced, the parse stage measures parsing itself rather than a load from the parsed-input cache
+        parse = cache.uncached(module.parse) if args.mem else module.parse
+        part1_input = part2_input = instrument(parse, args, f"{day:02d}-parse", profile=False)(lines)
+
+    # Solve part 1
+    part1_result = instrument(module.solve_part1, args, f"{day:02d}-part1")(part1_input)
+    print(f"Part 1: {part1_result}")
+
+    # Solve part 2
+    part2_result = instrument(module.solve_part2, args, f"{day:02d}-part2")(part2_input)
+    print(f"Part 2: {part2_result}")
@@ -0,0 +1,255 @@
+"""
+Generate valid, seeded puzzle inputs of any size for each day, to see how the solutions scale.
+
+The meaning of size depends on the day: a number of lines for list-like inputs (01, 02, 05, 07), a number of
+characters for day 03's corrupted memory, and the side length of the square grid for grid inputs (04, 06, 08).
+Generators take further keyword options shaping their inputs (such as day 05's update lengths), which generate passes
+through.
+"""
+
+import argparse
+import os
+import random
+import string
+
+GRID_FREQUENCIES = string.digits + string.ascii_letters
+
+# Days whose size is the side length of a square grid
+GRID_DAYS = (4, 6, 8)
+
+
+def generate_01(size: int, rng: random.Random) -> list[str]:
+    """Generate size lines of two location IDs, with plenty of repeats for part 2 to count."""
+    column_a = [rng.randint(10000, 99999) for _ in range(size)]
+    # Draw half of the right column from the left one, so the similarity score isn't always zero
+    column_b = [rng.choice(column_a) if rng.random() < 0.5 else rng.randint(10000, 99999) for _ in range(size)]
+    return [f"{a}   {b}" for a, b in zip(column_a, column_b)]
+
+
+def generate_02(size: int, rng: random.Random, min_levels: int = 5, max_levels: int = 8) -> list[str]:
+    """Generate size reports of min_levels to max_levels levels, a mix of safe, almost safe and unsafe ones."""
+    lines = []
+    for _ in range(size):
+        direction = rng.choice((1, -1))
+        report = [rng.randint(20, 70)]
+        for _ in range(rng.randint(min_levels - 1, max_levels - 1)):
+            report.append(report[-1] + direction * rng.randint(1, 3))
+        # Break roughly half of the reports, some of them in a way the Problem Dampener can repair
+        if rng.random() < 0.5:
+            report[rng.randrange(len(report))] += rng.choice((-5, -1, 0, 1, 5))
+        lines.append(" ".join(str(level) for level in report))
+    return lines
+
+
+def generate_03(size: int, rng: random.Random, line_length: int = 3000) -> list[str]:
+    """Generate roughly size characters of corrupted memory, split into lines of about line_length characters."""
+    garbage = "#$%&()*+,-/:;<>?@[]^_{}~ 'mulwhatfromselectdon"
+    tokens = []
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.25:
+            token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif roll < 0.28:
+            token = "do()"
+        elif roll < 0.31:
+            token = "don't()"
+        elif roll < 0.35:
+            # Near misses that must not be counted
+            token = rng.choice(("mul(4*", "mul[3,7]", "mul ( 2 , 4 )", "mul(6,9!", "?(12,34)", "do_not()"))
+        else:
+            token = "".join(rng.choice(garbage) for _ in range(rng.randint(1, 8)))
+        tokens.append(token)
+        length += len(token)
+
+    text = "".join(tokens)[:size]
+    return [text[i:i + line_length] for i in range(0, len(text), line_length)]
+
+
+def generate_04(size: int, rng: random.Random) -> list[str]:
+    """Generate a size by size word search grid of the letters X, M, A and S."""
+    return ["".join(rng.choice("XMAS") for _ in range(size)) for _ in range(size)]
+
+
+def generate_05(size: int, rng: random.Random, page_count: int | None = None, min_pages: int = 5,
+                max_pages: int = 23) -> list[str]:
+    """
+    Generate ordering rules between page_count pages (by default 49, or as many as the longest update needs), followed
+    by size updates of an odd number of pages from min_pages to max_pages, half of them out of order.
+    """
+    page_count = page_count or max(49, max_pages)
+    # Two-digit page numbers, unless there are more pages than that
+    pages = rng.sample(range(10, 10 + max(90, page_count)), page_count)
+    # A total order over the pages, with a rule for every pair of them
+    rules = [f"{pages[i]}|{pages[j]}" for i in range(page_count) for j in range(i + 1, page_count)]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(size):
+        indexes = sorted(rng.sample(range(page_count), rng.choice(range(min_pages | 1, max_pages + 1, 2))))
+        update = [pages[index] for index in indexes]
+        if rng.random() < 0.5:
+            rng.shuffle(update)
+        updates.append(",".join(str(page) for page in update))
+
+    return rules + [""] + updates
+
+
+GUARD_DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def guard_path(grid: list[list[str]], row: int, column: int) -> set[tuple[int, int]] | None:
+    """
+    Get the cells a guard starting at row, column facing up walks through before walking off the map, or None if they
+    end up in a loop instead.
+    """
+    direction = 0
+    seen = set()
+    while True:
+        if (row, column, direction) in seen:
+            return None
+        seen.add((row, column, direction))
+        next_row = row + GUARD_DIRECTIONS[direction][0]
+        next_column = column + GUARD_DIRECTIONS[direction][1]
+        if not (0 <= next_row < len(grid) and 0 <= next_column < len(grid[0])):
+            return {(row, column) for row, column, _ in seen}
+        if grid[next_row][next_column] == "#":
+            direction = (direction + 1) % 4
+        else:
+            row, column = next_row, next_column
+
+
+def spiral_obstacles(size: int, row: int, column: int, gap: int) -> list[tuple[int, int]]:
+    """
+    Get the obstacles turning a guard starting at row, column facing up into an outward spiral, its legs growing by gap
+    cells every second turn, until a leg runs off a size by size map.
+    """
+    obstacles = []
+    direction = 0
+    length = gap
+    while True:
+        row_step, column_step = GUARD_DIRECTIONS[direction]
+        row, column = row + row_step * length, column + column_step * length
+        obstacle = (row + row_step, column + column_step)
+        if not (0 <= obstacle[0] < size and 0 <= obstacle[1] < size):
+            return obstacles
+        obstacles.append(obstacle)
+        direction = (direction + 1) % 4
+        # Legs come in pairs of equal length (up and right, then down and left)
+        if direction % 2 == 0:
+            length += gap
+
+
+def generate_06(size: int, rng: random.Random, density: float = 0.05) -> list[str]:
+    """
+    Generate a size by size map whose guard, starting in the middle facing up, spirals outwards until they walk off the
+    map, so the patrol grows with the map (covering about a gap-th of it), with more obstacles scattered off the path.
+    """
+    gap = rng.randint(2, 4)
+    row = column = size // 2
+    grid = [["."] * size for _ in range(size)]
+    for obstacle_row, obstacle_column in spiral_obstacles(size, row, column, gap):
+        grid[obstacle_row][obstacle_column] = "#"
+    grid[row][column] = "^"
+
+    # The guard only ever looks at the cells of their path and the obstacles they turn at, so obstacles anywhere else
+    # leave the patrol unchanged
+    path = guard_path(grid, row, column)
+    for cell_row, line in enumerate(grid):
+        for cell_column, cell in enumerate(line):
+            if cell == "." and rng.random() < density and (cell_row, cell_column) not in path:
+                line[cell_column] = "#"
+    return ["".join(line) for line in grid]
+
+
+def generate_07(size: int, rng: random.Random, max_operands: int = 12) -> list[str]:
+    """Generate size calibration equations of 2 to max_operands operands, roughly half of them solvable."""
+    lines = []
+    for _ in range(size):
+        operands = [rng.randint(1, 99) for _ in range(rng.randint(2, max_operands))]
+        result = operands[0]
+        for operand in operands[1:]:
+            operation = rng.choice("+*|")
+            if operation == "+":
+                result += operand
+            elif operation == "*":
+                result *= operand
+            else:
+                result = int(f"{result}{operand}")
+        if rng.random() < 0.5:
+            result += rng.randint(1, 9)
+        lines.append(f"{result}: {' '.join(str(operand) for operand in operands)}")
+    return lines
+
+
+def generate_08(size: int, rng: random.Random, density: float = 0.01) -> list[str]:
+    """Generate a size by size map of antennas, at least two of each frequency used."""
+    grid = [["."] * size for _ in range(size)]
+    cells = rng.sample(range(size * size), max(2, int(size * size * density)) // 2 * 2)
+    frequencies = GRID_FREQUENCIES[:max(1, min(len(GRID_FREQUENCIES), len(cells) // 4))]
+    for i in range(0, len(cells), 2):
+        frequency = rng.choice(frequencies)
+        for cell in cells[i:i + 2]:
+            grid[cell // size][cell % size] = frequency
+    return ["".join(line) for line in grid]
+
+
+GENERATORS = {
+    1: generate_01,
+    2: generate_02,
+    3: generate_03,
+    4: generate_04,
+    5: generate_05,
+    6: generate_06,
+    7: generate_07,
+    8: generate_08,
+}
+
+
+def generate(day: int, size: int, seed: int = 0, **options) -> list[str]:
+    """Generate the input lines for a day at the given size, reproducibly for a given seed and generator options."""
+    return GENERATORS[day](size, random.Random(f"{day}:{size}:{seed}"), **options)
+
+
+def input_units(day: int, size: int) -> int:
+    """
+    Get the number of units (lines, characters or grid cells) an input of a given size grows with, leaving out any part
+    of it that doesn't grow with size, such as day 05's rules.
+    """
+    return size * size if day in GRID_DAYS else size
+
+
+def generated_name(size: int, seed: int = 0) -> str:
+    """Name of the input file a generated input is written to."""
+    return f"generated-{size}-{seed}.txt"
+
+
+def write_generated(day: int, size: int, seed: int = 0) -> str:
+    """Generate an input for a day and write it under inputs/NN/, returning its path."""
+    input_dir = os.path.join("inputs", f"{day:02d}")
+    os.makedirs(input_dir, exist_ok=True)
+    path = os.path.join(input_dir, generated_name(size, seed))
+    with open(path, "w", encoding="utf-8") as file:
+        for line in generate(day, size, seed):
+            file.write(line + "\n")
+    return path
+
+
+def main():
+    """Main function to write generated inputs."""
+    parser = argparse.ArgumentParser(description='Generate large Advent of Code puzzle inputs')
+    parser.add_argument('days', type=int, nargs='*',
+                       help='Day numbers to generate inputs for (default: every day with a generator)')
+    parser.add_argument('--size', type=int, action='append', required=True,
+                       help='Size of the input to generate (may be repeated)')
+    parser.add_argument('--seed', type=int, default=0,
+                       help='Seed for the random number generator')
+    args = parser.parse_args()
+
+    for day in args.days or sorted(GENERATORS):
+        for size in args.size:
+            print(write_generated(day, size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
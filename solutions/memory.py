@@ -0,0 +1,138 @@
+"""Measure the memory solutions allocate with tracemalloc."""
+
+import os
+import sys
+import tracemalloc
+
+
+def format_bytes(size: float) -> str:
+    """Format a number of bytes with a binary unit."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024 or unit == "GiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class MemoryTracer:
+    """
+    Trace the allocations of calls, reporting peak memory, how much they allocated along the way, the sites holding
+    memory near the peak and the memory still held on return.
+    """
+
+    # Factor and least number of bytes by which the memory a call holds has to grow before its sites are snapshotted
+    # again, so only a few snapshots are taken however it rises
+    SNAPSHOT_GROWTH = 1.25
+    SNAPSHOT_MIN_BYTES = 64 * 1024
+
+    def __init__(self, top: int = 10, frames: int = 1):
+        # Number of allocation sites to list per report
+        self.top = top
+        # Number of stack frames recorded per allocation
+        self.frames = frames
+        self._filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        self._before = None
+        self._reset(0)
+
+    def _reset(self, baseline: int):
+        """Reset the sampling state of a call starting with baseline bytes traced."""
+        self._baseline = self._last = baseline
+        self._peak = baseline
+        self._allocated = 0
+        # Bytes held by this tracer's own bookkeeping, left out of the samples
+        self._overhead = 0
+        # Bytes the call held at its last snapshot
+        self._snapshot_level = 0
+        self._peak_sites = None
+
+    def _compare(self, snapshot: tracemalloc.Snapshot) -> list[tracemalloc.StatisticDiff]:
+        """Compare the allocation sites of a snapshot to those before the call, largest difference first."""
+        return snapshot.filter_traces(self._filters).compare_to(self._before.filter_traces(self._filters), "lineno")
+
+    def _statistics(self, snapshot: tracemalloc.Snapshot) -> list[tracemalloc.StatisticDiff]:
+        """Get the top allocation sites holding more memory in a snapshot than before the call."""
+        return [difference for difference in self._compare(snapshot) if difference.size_diff > 0][:self.top]
+
+    def _sample(self, _frame=None, event: str = "return", _arg=None):
+        """
+        Profile hook sampling traced memory at every call and return of Python code. Allocations are counted as rises
+        in the bytes traced, including rises between samples that were freed again, so churn shows even without growth.
+        """
+        if event.startswith("c_"):
+            # Calls to C code are covered by the samples around them
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        current -= self._overhead
+        peak -= self._overhead
+        self._allocated += max(0, peak - self._last)
+        self._last = current
+        self._peak = max(self._peak, peak)
+        held = current - self._baseline
+        level = self._snapshot_level
+        if self.top and held > max(level * self.SNAPSHOT_GROWTH, level + self.SNAPSHOT_MIN_BYTES):
+            self._snapshot_level = held
+            self._peak_sites = self._statistics(tracemalloc.take_snapshot())
+            # The snapshot is freed, but the sites kept from it aren't part of the call
+            self._overhead += tracemalloc.get_traced_memory()[0] - self._overhead - current
+        tracemalloc.reset_peak()
+
+    def run(self, func, *args):
+        """
+        Call func while tracing its allocations, returning its result and a report.
+
+        The report holds the peak memory allocated during the call and at least how much it allocated in all, sampled
+        at every function call and return (allocations made and freed within one call to C code only count towards
+        the peak). It also lists the top allocation sites holding memory at the highest sampled point, and the bytes
+        and blocks still allocated when the call returned (which includes its result).
+        """
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start(self.frames)
+        self._before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        self._reset(baseline)
+        profile = sys.getprofile()
+        tracemalloc.reset_peak()
+        sys.setprofile(self._sample)
+        try:
+            result = func(*args)
+        finally:
+            sys.setprofile(profile)
+            self._sample()
+            after = tracemalloc.take_snapshot()
+            if not was_tracing:
+                tracemalloc.stop()
+
+        retained = self._compare(after)
+        if self._peak_sites is None or self._last - baseline >= self._snapshot_level:
+            self._peak_sites = self._statistics(after)
+        report = {
+            "peak_bytes": self._peak - baseline,
+            "allocated_bytes": self._allocated,
+            "retained_bytes": sum(difference.size_diff for difference in retained),
+            "retained_blocks": sum(max(0, difference.count_diff) for difference in retained),
+            "top": [
+                {
+                    "site": f"{os.path.basename(difference.traceback[0].filename)}:{difference.traceback[0].lineno}",
+                    "size": difference.size_diff,
+                    "count": difference.count_diff,
+                }
+                for difference in self._peak_sites
+            ],
+        }
+        self._before = self._peak_sites = None
+        return result, report
+
+
+def format_memory_report(label: str, report: dict) -> str:
+    """Format a MemoryTracer report as text."""
+    lines = [
+        f"== {label}: peak {format_bytes(report['peak_bytes'])}, "
+        f"allocated at least {format_bytes(report['allocated_bytes'])}, "
+        f"retained {format_bytes(report['retained_bytes'])} in {report['retained_blocks']} blocks"
+    ]
+    if report["top"]:
+        lines.append("  held near the peak:")
+    for site in report["top"]:
+        lines.append(f"    {site['site']}: {format_bytes(site['size'])} in {site['count']} blocks")
+    return "\n".join(lines)
@@ -0,0 +1,37 @@
+"""Profile solutions with cProfile, reporting their hottest functions."""
+
+import cProfile
+import io
+import os
+import pstats
+
+
+class Profiler:
+    """Profile calls with cProfile, reporting the top functions by cumulative and by self time."""
+
+    def __init__(self, top: int = 20, dump_dir: str | None = None):
+        # Number of functions to list in each section of the report
+        self.top = top
+        # Directory to dump .prof files to, for tools like snakeviz or pstats
+        self.dump_dir = dump_dir
+
+    def run(self, label: str, func, *args):
+        """Call func under the profiler, returning its result and a text report labelled with label."""
+        profile = cProfile.Profile()
+        result = profile.runcall(func, *args)
+
+        if self.dump_dir:
+            os.makedirs(self.dump_dir, exist_ok=True)
+            profile.dump_stats(os.path.join(self.dump_dir, f"{label}.prof"))
+
+        return result, self.report(label, profile)
+
+    def report(self, label: str, profile: cProfile.Profile) -> str:
+        """Format the top functions of a profile by cumulative and by self time."""
+        sections = []
+        for sort_key, title in (("cumulative", "cumulative time"), ("tottime", "self time")):
+            stream = io.StringIO()
+            stats = pstats.Stats(profile, stream=stream).strip_dirs().sort_stats(sort_key)
+            stats.print_stats(self.top)
+            sections.append(f"== {label}: top {self.top} functions by {title}\n{stream.getvalue().strip()}")
+        return "\n\n".join(sections)
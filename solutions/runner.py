@@ -0,0 +1,336 @@
+"""Run and benchmark several days of Advent of Code solutions in a single interpreter."""
+
+import contextlib
+import importlib
+import io
+import json
+import math
+import os
+import statistics
+import time
+from solutions import cache
+from solutions.cli import import_dependencies
+from solutions.utils import iter_lines, read_input
+
+SOLUTIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+PARTS = (1, 2)
+PARSE = "parse"
+LOAD = "load"
+
+
+def discover_days() -> list[int]:
+    """Find every solutions/NN.py module (excluding the 00 template) and return their day numbers."""
+    days = []
+    for file_name in os.listdir(SOLUTIONS_DIR):
+        stem, extension = os.path.splitext(file_name)
+        if extension == ".py" and len(stem) == 2 and stem.isdigit() and stem != "00":
+            days.append(int(stem))
+    return sorted(days)
+
+
+def load_day(day: int):
+    """
+    Import the solution module for a given day, along with the modules it only imports where they're used, so their
+    import isn't timed as part of its first call.
+    """
+    module = importlib.import_module(f"solutions.{day:02d}")
+    import_dependencies(module)
+    return module
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def time_call(func, *args):
+    """Call func once and return its result alongside the wall and CPU time it took, in seconds."""
+    # Solutions print debugging output; keep it out of the report (and the terminal)
+    with contextlib.redirect_stdout(io.StringIO()):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = func(*args)
+        cpu_end = time.process_time()
+        wall_end = time.perf_counter()
+    return result, wall_end - wall_start, cpu_end - cpu_start
+
+
+class PartResult:
+    """The answer and timing samples of one part (or the parse stage) of one day."""
+
+    def __init__(self, day: int, part: int | str):
+        self.day = day
+        self.part = part
+        self.answer = None
+        self.error: str | None = None
+        self.wall_times: list[float] = []
+        self.cpu_times: list[float] = []
+        # cProfile report of an extra, untimed run, when profiling
+        self.profile: str | None = None
+        # tracemalloc report of an extra, untimed run, when tracing memory
+        self.memory: dict | None = None
+
+    def fail(self, error: Exception) -> "PartResult":
+        """Record the error that stopped this part (or stage), returning the result itself."""
+        self.error = f"{type(error).__name__}: {error}"
+        return self
+
+    def add_sample(self, wall: float, cpu: float) -> None:
+        """Record the timings of a single run."""
+        self.wall_times.append(wall)
+        self.cpu_times.append(cpu)
+
+    def stats(self, samples: list[float]) -> dict[str, float]:
+        """Summarise a list of timing samples."""
+        if not samples:
+            return {}
+        return {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "p95": percentile(samples, 95),
+        }
+
+    def to_dict(self) -> dict:
+        """Representation of the result suitable for JSON output."""
+        return {
+            "day": self.day,
+            "part": self.part,
+            "answer": self.answer,
+            "error": self.error,
+            "runs": len(self.wall_times),
+            "wall": self.stats(self.wall_times),
+            "cpu": self.stats(self.cpu_times),
+            "profile": self.profile,
+            "memory": self.memory,
+        }
+
+
+def measure(result: PartResult, func, argument, repeat: int = 1):
+    """
+    Call func(argument) repeat times, recording timings on result, and return the value of the last call.
+
+    argument is either passed as is, or is a callable returning a fresh argument for each call.
+    """
+    value = None
+    for _ in range(repeat):
+        try:
+            value, wall, cpu = time_call(func, argument() if callable(argument) else argument)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            result.fail(error)
+            return None
+        result.add_sample(wall, cpu)
+    return value
+
+
+def trace_memory(result: PartResult, tracer: "MemoryTracer | None", func, argument):
+    """With a tracer, call func(argument) once more while tracing its memory use, recording the report on result."""
+    if tracer and not result.error:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, result.memory = tracer.run(func, argument() if callable(argument) else argument)
+
+
+def run_parse(module, day: int, lines: list[str], repeat: int = 1,
+              tracer: "MemoryTracer | None" = None) -> tuple[PartResult, object]:
+    """
+    Parse a day's input repeat times, returning the parse timings and the parsed input.
+
+    The parsed-input cache is bypassed, so every run parses from scratch (see run_load for timing the cache).
+    """
+    result = PartResult(day, PARSE)
+    parse = cache.uncached(module.parse)
+    parsed = measure(result, parse, lines, repeat)
+    trace_memory(result, tracer, parse, lines)
+    return result, parsed
+
+
+def run_load(module, day: int, lines: list[str], repeat: int = 1) -> PartResult | None:
+    """
+    Load a day's parsed input from the on-disk cache repeat times, returning the load timings, or None when the
+    cache is off or the day's parser isn't cached.
+
+    The entry is stored by an untimed call first, if missing, so only loads are timed.
+    """
+    if not cache.is_enabled() or not cache.is_cached(module.parse):
+        return None
+    result = PartResult(day, LOAD)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module.parse(lines)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return result.fail(error)
+    measure(result, module.parse, lines, repeat)
+    return result
+
+
+def run_part(module, day: int, part: int, parsed, repeat: int = 1, profiler: "Profiler | None" = None,
+             tracer: "MemoryTracer | None" = None) -> PartResult:
+    """
+    Run one part of a day repeat times, collecting the answer and timings.
+
+    parsed is either the parsed input shared by every run, or a callable returning freshly parsed input for each run.
+    With a profiler or memory tracer, the part is run once more under each (so their overhead stays out of the
+    timings).
+    """
+    result = PartResult(day, part)
+    solve = getattr(module, f"solve_part{part}")
+    result.answer = measure(result, solve, parsed, repeat)
+    if profiler and not result.error:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, result.profile = profiler.run(f"{day:02d}-part{part}", solve, parsed() if callable(parsed) else parsed)
+    trace_memory(result, tracer, solve, parsed)
+    return result
+
+
+def run_days(days: list[int], parts: tuple[int, ...] = PARTS, test: bool = False, repeat: int = 1,
+             stream: bool = False, profiler: "Profiler | None" = None, tracer: "MemoryTracer | None" = None,
+             input_name: str | None = None):
+    """
+    Run the requested parts of the requested days, yielding a PartResult as each one finishes.
+
+    input_name selects another file in each day's inputs directory, such as a generated input.
+
+    Each day's input is parsed once (timed as its own "parse" result) and shared by its parts. With stream, days
+    marked STREAMABLE instead parse a lazy stream of lines from disk on every run, as part of each part's timing.
+
+    A day whose module or input can't be loaded gets a parse result recording the error, and the other days still run.
+    """
+    for day in days:
+        try:
+            module = load_day(day)
+            lines = None if stream and getattr(module, "STREAMABLE", False) else read_input(day, test=test,
+                                                                                            name=input_name)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            yield PartResult(day, PARSE).fail(error)
+            continue
+
+        if lines is None:
+            parsed = lambda module=module, day=day: module.parse(iter_lines(day, test=test, name=input_name))
+        else:
+            parse_result, parsed = run_parse(module, day, lines, repeat, tracer)
+            yield parse_result
+            if parse_result.error:
+                continue
+            load_result = run_load(module, day, lines, repeat)
+            if load_result:
+                yield load_result
+        for part in parts:
+            yield run_part(module, day, part, parsed, repeat, profiler, tracer)
+
+
+def run_job(day: int, part: int | str, test: bool = False, repeat: int = 1, stream: bool = False,
+            profiler: "Profiler | None" = None, tracer: "MemoryTracer | None" = None,
+            input_name: str | None = None) -> PartResult:
+    """
+    Run a single (day, part) job from scratch, as done by the worker processes of run_days_parallel.
+
+    part may be PARSE to time the parse stage or LOAD to time loading it from the cache; otherwise the day's input is
+    parsed (untimed, through the cache) before timing the part.
+    """
+    try:
+        module = load_day(day)
+        streamed = part != PARSE and stream and getattr(module, "STREAMABLE", False)
+        lines = None if streamed else read_input(day, test=test, name=input_name)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return PartResult(day, part).fail(error)
+
+    if part == PARSE:
+        return run_parse(module, day, lines, repeat, tracer)[0]
+    if part == LOAD:
+        return run_load(module, day, lines, repeat)
+
+    if lines is None:
+        parsed = lambda: module.parse(iter_lines(day, test=test, name=input_name))
+    else:
+        parse_result = PartResult(day, PARSE)
+        parsed = measure(parse_result, module.parse, lines)
+        if parse_result.error:
+            result = PartResult(day, part)
+            result.error = parse_result.error
+            return result
+    return run_part(module, day, part, parsed, repeat, profiler, tracer)
+
+
+def run_days_parallel(days: list[int], parts: tuple[int, ...] = PARTS, test: bool = False, repeat: int = 1,
+                      stream: bool = False, workers: int | None = None, profiler: "Profiler | None" = None,
+                      tracer: "MemoryTracer | None" = None, input_name: str | None = None):
+    """
+    Run the requested parts of the requested days as independent jobs in a pool of worker processes.
+
+    Every (day, part) job, and every day's parse stage, runs and is timed within a single worker, and a PartResult is
+    yielded as each job completes, so results arrive in completion order rather than day order. A job that fails
+    outright (including its worker dying) yields a result recording the error.
+    """
+    import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+    jobs = []
+    for day in days:
+        try:
+            module = load_day(day)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # A day that can't be loaded gets a single result recording the error, rather than one per job
+            yield PartResult(day, PARSE).fail(error)
+            continue
+        streamed = stream and getattr(module, "STREAMABLE", False)
+        if not streamed:
+            jobs.append((day, PARSE))
+            if cache.is_enabled() and cache.is_cached(module.parse):
+                jobs.append((day, LOAD))
+        jobs.extend((day, part) for part in parts)
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=cache.set_enabled, initargs=(cache.is_enabled(),)
+    ) as executor:
+        futures = {
+            executor.submit(run_job, day, part, test, repeat, stream, profiler, tracer, input_name): (day, part)
+            for day, part in jobs
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                yield PartResult(*futures[future]).fail(error)
+
+
+def format_milliseconds(seconds: float | None) -> str:
+    """Format a duration in seconds as milliseconds for the table output."""
+    return "-" if seconds is None else f"{seconds * 1000:.3f}"
+
+
+TABLE_COLUMNS = ("day", "part", "answer", "runs", "wall min", "wall med", "wall p95", "cpu med")
+
+
+def format_row(result: PartResult) -> tuple[str, ...]:
+    """Format a result as a row of table cells."""
+    wall = result.stats(result.wall_times)
+    cpu = result.stats(result.cpu_times)
+    if result.error:
+        answer = result.error
+    else:
+        answer = "-" if result.part in (PARSE, LOAD) else str(result.answer)
+    return (
+        f"{result.day:02d}",
+        str(result.part),
+        answer,
+        str(len(result.wall_times)),
+        format_milliseconds(wall.get("min")),
+        format_milliseconds(wall.get("median")),
+        format_milliseconds(wall.get("p95")),
+        format_milliseconds(cpu.get("median")),
+    )
+
+
+def format_table(results: list[PartResult]) -> str:
+    """Format results as a plain text table, with times in milliseconds."""
+    rows = [TABLE_COLUMNS] + [format_row(result) for result in results]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(TABLE_COLUMNS))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
+
+
+def format_json(results: list[PartResult]) -> str:
+    """Format results as JSON, with times in seconds."""
+    return json.dumps([result.to_dict() for result in results], indent=2, default=str)
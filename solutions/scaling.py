@@ -0,0 +1,178 @@
+"""
+Measure how each day's parse stage and parts scale with the size of generated inputs.
+
+Every stage is run on geometrically growing inputs from solutions.generators, recording its time and peak memory.
+A power law is then fitted against the units the input grows by (lines, characters or grid cells, leaving out fixed
+parts such as day 05's rules), so an exponent of about 1 means linear growth, and anything well above it flags a
+super-linear hot path. Instead of the size, a generator option can be grown (such as day 05's max_pages, to grow its
+updates rather than their number), which the power law is then fitted against.
+"""
+
+import contextlib
+import io
+import json
+import math
+from solutions import cache
+from solutions.generators import GENERATORS, generate, input_units
+from solutions.memory import MemoryTracer, format_bytes
+from solutions.runner import PARSE, PARTS, load_day, time_call
+
+# Starting size per day (see solutions.generators for what a size means for each day)
+DEFAULT_START_SIZES = {1: 1000, 2: 1000, 3: 10000, 4: 16, 5: 100, 6: 16, 7: 100, 8: 16}
+
+# Exponent above which growth is flagged as super-linear
+SUPER_LINEAR_EXPONENT = 1.3
+
+
+def fit_exponent(sizes: list[float], values: list[float]) -> float | None:
+    """Least-squares fit of the exponent k in value = c * size ** k, or None without two usable points."""
+    points = [(math.log(size), math.log(value)) for size, value in zip(sizes, values) if size > 0 and value > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+class ScalingResult:
+    """Time and memory measurements of one stage (the parse stage or a part) of a day across input sizes."""
+
+    def __init__(self, day: int, part: int | str, parameter: str = "size"):
+        self.day = day
+        self.part = part
+        # The size, or the generator option grown instead of it
+        self.parameter = parameter
+        self.error: str | None = None
+        # Set once a run exceeds the time budget, to stop measuring larger sizes
+        self.stopped = False
+        # One dict per measured size, holding the value of the grown parameter, the input units and bytes, time
+        # (seconds) and peak memory (bytes)
+        self.points: list[dict] = []
+
+    def exponent(self, key: str) -> float | None:
+        """Fitted growth exponent of a measurement against the input units."""
+        return fit_exponent([point["units"] for point in self.points], [point[key] for point in self.points])
+
+    @property
+    def is_super_linear(self) -> bool:
+        """Check if the time or memory of this stage grows faster than linearly."""
+        return any(
+            exponent is not None and exponent > SUPER_LINEAR_EXPONENT
+            for exponent in (self.exponent("time"), self.exponent("peak"))
+        )
+
+    def to_dict(self) -> dict:
+        """Representation of the result suitable for JSON output."""
+        return {
+            "day": self.day,
+            "part": self.part,
+            "parameter": self.parameter,
+            "error": self.error,
+            "time_exponent": self.exponent("time"),
+            "memory_exponent": self.exponent("peak"),
+            "super_linear": self.is_super_linear,
+            "points": self.points,
+        }
+
+
+def measure_scaling(day: int, parts: tuple[int, ...] = PARTS, start: int | None = None, factor: int = 2,
+                    steps: int = 6, repeat: int = 3, seed: int = 0, time_budget: float = 10.0, grow: str | None = None):
+    """
+    Measure the parse stage and the given parts of a day at steps geometrically growing sizes, or with grow, at the
+    day's starting size and steps geometrically growing values (from start) of that generator option.
+
+    Each stage is timed repeat times (keeping the fastest run) and traced once for peak memory. A stage stops growing
+    once a single run of it takes longer than time_budget seconds, or as soon as it fails.
+    """
+    if grow and not start:
+        raise ValueError(f"Growing {grow} needs a start value")
+    module = load_day(day)
+    tracer = MemoryTracer(top=0)
+    results = {stage: ScalingResult(day, stage, grow or "size") for stage in (PARSE, *parts)}
+    size = start if start and not grow else DEFAULT_START_SIZES.get(day, 100)
+    # Value of the grown parameter, which is the size itself unless a generator option is grown
+    value = start if grow else size
+
+    for _ in range(steps):
+        active = [stage for stage, result in results.items() if not result.error and not result.stopped]
+        if not active:
+            break
+
+        try:
+            lines = generate(day, size, seed, **{grow: value} if grow else {})
+            parsed = time_call(module.parse, lines)[0]
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            for result in results.values():
+                result.error = result.error or f"{type(error).__name__}: {error}"
+            break
+        input_bytes = sum(len(line) + 1 for line in lines)
+        units = value if grow else input_units(day, size)
+
+        for stage in active:
+            result = results[stage]
+            if stage == PARSE:
+                func, argument = module.parse, lines
+            else:
+                func, argument = getattr(module, f"solve_part{stage}"), parsed
+            try:
+                wall = min(time_call(func, argument)[1] for _ in range(repeat))
+                with contextlib.redirect_stdout(io.StringIO()):
+                    _, report = tracer.run(func, argument)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                result.error = f"{type(error).__name__}: {error}"
+                continue
+            result.points.append({
+                result.parameter: value, "units": units, "bytes": input_bytes,
+                "time": wall, "peak": report["peak_bytes"],
+            })
+            result.stopped = wall > time_budget
+
+        value *= factor
+        if not grow:
+            size = value
+
+    return list(results.values())
+
+
+def run_scaling(days: list[int], parts: tuple[int, ...] = PARTS, **kwargs):
+    """Measure the scaling of every requested day with a generator, yielding a ScalingResult per stage."""
+    with cache.disabled():
+        for day in days:
+            if day in GENERATORS:
+                yield from measure_scaling(day, parts, **kwargs)
+
+
+def format_exponent(exponent: float | None) -> str:
+    """Format a fitted exponent for the report."""
+    return "-" if exponent is None else f"{exponent:.2f}"
+
+
+def format_scaling_report(results: list[ScalingResult]) -> str:
+    """Format scaling results as a summary of growth exponents followed by the measured curve of each stage."""
+    lines = ["day  part   time exp  mem exp  flag"]
+    for result in results:
+        flag = result.error or ("SUPER-LINEAR" if result.is_super_linear else "")
+        lines.append(
+            f"{result.day:02d}   {str(result.part):<5}  {format_exponent(result.exponent('time')):<8}  "
+            f"{format_exponent(result.exponent('peak')):<7}  {flag}".rstrip()
+        )
+
+    for result in results:
+        if not result.points:
+            continue
+        lines.append(f"\n== {result.day:02d}-{result.part}")
+        lines.append(f"{result.parameter:>10}  {'units':>12}  {'bytes':>12}  {'time ms':>12}  {'peak mem':>10}")
+        for point in result.points:
+            lines.append(
+                f"{point[result.parameter]:>10}  {point['units']:>12}  {point['bytes']:>12}  "
+                f"{point['time'] * 1000:>12.3f}  {format_bytes(point['peak']):>10}"
+            )
+    return "\n".join(lines)
+
+
+def format_scaling_json(results: list[ScalingResult]) -> str:
+    """Format scaling results as JSON, with times in seconds and memory in bytes."""
+    return json.dumps([result.to_dict() for result in results], indent=2)
@@ -0,0 +1,54 @@
+"""
+Measure how long each day module takes to import, using `python -X importtime`, against a per-day budget.
+
+Each measurement runs in a fresh interpreter, so it reflects what a `python -m solutions.NN` invocation pays before
+it starts solving. The cumulative import time of the day module (including everything it imports that the
+interpreter hadn't already loaded) is compared against its budget.
+"""
+
+import subprocess
+import sys
+
+# Import-time budget of a day module in milliseconds, unless overridden in IMPORT_BUDGETS_MS
+DEFAULT_IMPORT_BUDGET_MS = 25.0
+
+# Per-day overrides of the import-time budget, in milliseconds
+IMPORT_BUDGETS_MS: dict[int, float] = {}
+
+
+def import_budget(day: int) -> float:
+    """Import-time budget of a day module, in milliseconds."""
+    return IMPORT_BUDGETS_MS.get(day, DEFAULT_IMPORT_BUDGET_MS)
+
+
+def measure_import_time(day: int) -> float:
+    """Import a day module in a fresh interpreter and return its cumulative import time, in milliseconds."""
+    module_name = f"solutions.{day:02d}"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"__import__({module_name!r})"],
+        capture_output=True, text=True, check=True,
+    )
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    for line in completed.stderr.splitlines():
+        _, _, timings = line.partition("import time:")
+        fields = [field.strip() for field in timings.split("|")]
+        if len(fields) == 3 and fields[2] == module_name:
+            return int(fields[1]) / 1000
+    raise ValueError(f"No import time reported for {module_name}")
+
+
+def check_startup(days: list[int], repeat: int = 5):
+    """Measure the import time of each day (the fastest of repeat fresh interpreters), yielding a dict per day."""
+    for day in days:
+        import_ms = min(measure_import_time(day) for _ in range(repeat))
+        budget_ms = import_budget(day)
+        yield {"day": day, "import_ms": import_ms, "budget_ms": budget_ms, "within_budget": import_ms <= budget_ms}
+
+
+def format_startup_report(results: list[dict]) -> str:
+    """Format startup results as a plain text table."""
+    lines = ["day  import ms  budget ms  status"]
+    for result in results:
+        status = "ok" if result["within_budget"] else "OVER BUDGET"
+        lines.append(f"{result['day']:02d}   {result['import_ms']:>9.3f}  {result['budget_ms']:>9.3f}  {status}")
+    return "\n".join(lines)
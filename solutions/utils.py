@@ -1,7 +1,76 @@
-def read_input(day, test=False):
-    """Read the input file for a specific day and return a list of strings, one per line."""
-    file_name = "test.txt" if test else "input.txt"
-    file_path = f"inputs/{day:02d}/{file_name}"
+import contextlib
+import mmap
+import os
+from collections.abc import Iterator
+
+
+def input_path(day, test=False, name=None):
+    """Return the path of the input file for a specific day, or of the file called name in its inputs directory."""
+    file_name = name or ("test.txt" if test else "input.txt")
+    return f"inputs/{day:02d}/{file_name}"
+
 
-    with open(file_path, 'r') as file:
+def read_input(day, test=False, name=None):
+    """Read the input file for a specific day and return a list of strings, one per line."""
+    with open(input_path(day, test, name), 'r') as file:
         return [line.strip() for line in file]
+
+
+def iter_lines(day, test=False, name=None) -> Iterator[str]:
+    """Lazily yield the stripped lines of the input file for a specific day, one at a time."""
+    with open(input_path(day, test, name), 'r') as file:
+        for line in file:
+            yield line.strip()
+
+
+@contextlib.contextmanager
+def map_input(day, test=False, name=None):
+    """Memory-map the input file for a specific day, yielding a read-only bytes-like view of it."""
+    with open(input_path(day, test, name), 'rb') as file:
+        # mmap refuses to map empty files
+        if not file.seek(0, 2):
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield view
+
+
+def read_chunks(day, test=False, chunk_size=1 << 20, name=None) -> Iterator[bytes]:
+    """Lazily yield the raw bytes of the input file for a specific day in chunks of at most chunk_size."""
+    with open(input_path(day, test, name), 'rb') as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def split_byte_ranges(day, count, test=False, name=None) -> list[tuple[int, int]]:
+    """
+    Split the input file for a specific day into at most count (start, end) byte ranges of about equal size, each
+    ending just after a newline (or at the end of the file) so no line straddles two ranges.
+    """
+    with map_input(day, test, name) as view:
+        size = len(view)
+        boundaries = [0]
+        for i in range(1, count):
+            # Move each boundary past the end of the line it falls in
+            newline = view.find(b"\n", max(size * i // count, boundaries[-1]))
+            if newline == -1:
+                break
+            boundaries.append(newline + 1)
+        boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+
+def worker_byte_ranges(day, workers=None, chunk_bytes=64 << 20, test=False, name=None,
+                       lines=True) -> tuple[int, list[tuple[int, int]]]:
+    """
+    Plan splitting the input file for a specific day between workers processes (one per CPU by default), returning
+    the number of workers and the (start, end) byte ranges to hand out to them: at least a range per worker, and more
+    of them for inputs too large to hand out in ranges of at most about chunk_bytes each. The ranges are split on
+    newlines unless lines is false, in which case they are of exactly equal size.
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(input_path(day, test, name))
+    count = max(workers, -(-size // chunk_bytes))
+    if lines:
+        return workers, split_byte_ranges(day, count, test=test, name=name)
+    return workers, [(size * i // count, size * (i + 1) // count) for i in range(count)]
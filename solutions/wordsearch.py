@@ -0,0 +1,157 @@
+"""
+Find every occurrence of many words at once in a grid of letters, in all 8 directions, like day 04's word search.
+
+The words and their reversals are compiled into a single Aho–Corasick automaton, which then reads every row, column
+and diagonal of the grid once. A match of a word reads it forwards along the line, and a match of its reversal reads
+it backwards, so the grid is read once however many words there are.
+
+An occurrence is a word spelled along some cells in some direction. A palindrome spelled along the same cells in both
+directions counts once, as does a single letter word (which reads the same in all 8 directions).
+"""
+
+import argparse
+from collections import deque
+from collections.abc import Iterable, Iterator
+from solutions.utils import read_input
+
+
+class AhoCorasick:
+    """Automaton matching every pattern of a set at once in a single pass over a sequence of characters."""
+
+    def __init__(self, patterns: Iterable[tuple[str, object]]):
+        # Trie of the patterns, as the transitions of each state, with state 0 as the root
+        self.transitions: list[dict[str, int]] = [{}]
+        # State to fall back to on a missing transition: the longest proper suffix of the state that is in the trie
+        self.fallbacks: list[int] = [0]
+        # Values of the patterns ending at each state, including those of its suffixes, as (length, value) pairs
+        self.outputs: list[list[tuple[int, object]]] = [[]]
+
+        for pattern, value in patterns:
+            if pattern:
+                self.add(pattern, value)
+        self.link()
+
+    def add(self, pattern: str, value) -> None:
+        """Add a pattern to the trie, with the value to report when it matches."""
+        state = 0
+        for char in pattern:
+            if char not in self.transitions[state]:
+                self.transitions.append({})
+                self.fallbacks.append(0)
+                self.outputs.append([])
+                self.transitions[state][char] = len(self.transitions) - 1
+            state = self.transitions[state][char]
+        self.outputs[state].append((len(pattern), value))
+
+    def link(self) -> None:
+        """Compute the fallback of every state breadth first, merging in the outputs of the fallback."""
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.transitions[state].items():
+                fallback = self.fallbacks[state]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.fallbacks[fallback]
+                self.fallbacks[child] = self.transitions[fallback].get(char, 0)
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fallbacks[child]]
+                queue.append(child)
+
+    def scan(self, text: Iterable[str]) -> Iterator[tuple[int, int, object]]:
+        """Yield the (end index, length, value) of every match in text, overlapping ones included."""
+        transitions, fallbacks, outputs = self.transitions, self.fallbacks, self.outputs
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in transitions[state]:
+                state = fallbacks[state]
+            state = transitions[state].get(char, 0)
+            for length, value in outputs[state]:
+                yield index, length, value
+
+
+def grid_lines(lines: list[str]) -> Iterator[tuple[tuple[int, int], tuple[int, int]]]:
+    """
+    Yield every row, column and diagonal of a grid (left to right, top to bottom, down-right and down-left) as its
+    starting cell and step, which together cover all 8 directions once read both ways.
+    """
+    rows = len(lines)
+    cols = len(lines[0]) if lines else 0
+    for row in range(rows):
+        yield (row, 0), (0, 1)
+    for col in range(cols):
+        yield (0, col), (1, 0)
+    for start in [(row, 0) for row in range(rows)] + [(0, col) for col in range(1, cols)]:
+        yield start, (1, 1)
+    for start in [(0, col) for col in range(cols)] + [(row, cols - 1) for row in range(1, rows)]:
+        yield start, (1, -1)
+
+
+def read_line(lines: list[str], start: tuple[int, int], step: tuple[int, int]) -> Iterator[str]:
+    """Lazily read the letters of a grid from a starting cell, one step at a time until leaving the grid."""
+    (row, col), (row_step, col_step) = start, step
+    rows, cols = len(lines), len(lines[0])
+    while 0 <= row < rows and 0 <= col < cols:
+        yield lines[row][col]
+        row += row_step
+        col += col_step
+
+
+class WordSearch:
+    """Search a grid of letters for a dictionary of words in all 8 directions."""
+
+    def __init__(self, words: Iterable[str]):
+        self.words = sorted(set(word for word in words if word))
+        patterns = []
+        for word in self.words:
+            patterns.append((word, (word, False)))
+            # A palindrome read backwards is the same occurrence as read forwards
+            if word[::-1] != word:
+                patterns.append((word[::-1], (word, True)))
+        self.automaton = AhoCorasick(patterns)
+
+    def find(self, lines: list[str]) -> Iterator[tuple[str, tuple[int, int], tuple[int, int]]]:
+        """Yield every occurrence of every word as the word, the cell of its first letter and its direction."""
+        for start, step in grid_lines(lines):
+            (row, col), (row_step, col_step) = start, step
+            for end, length, (word, backwards) in self.automaton.scan(read_line(lines, start, step)):
+                # A single letter word only needs to be read along one kind of line
+                if length == 1 and step != (0, 1):
+                    continue
+                first = end if backwards else end - length + 1
+                direction = (-row_step, -col_step) if backwards else step
+                yield word, (row + first * row_step, col + first * col_step), direction
+
+    def count(self, lines: list[str]) -> dict[str, int]:
+        """Count the occurrences of every word."""
+        counts = dict.fromkeys(self.words, 0)
+        for word, _, _ in self.find(lines):
+            counts[word] += 1
+        return counts
+
+
+def main():
+    """Main function to search a day 04 grid for words."""
+    parser = argparse.ArgumentParser(description='Search a word search grid for many words at once')
+    parser.add_argument('words', nargs='*',
+                       help='Words to search for')
+    parser.add_argument('--words-file', default=None,
+                       help='Also search for the words in this file, one per line')
+    parser.add_argument('--day', type=int, default=4,
+                       help='Day whose input is the grid to search')
+    parser.add_argument('--test', action='store_true', default=False,
+                       help='Search the test input instead of the real input')
+    parser.add_argument('--input', default=None,
+                       help='Search this file from the inputs directory of the day instead')
+    args = parser.parse_args()
+
+    words = list(args.words)
+    if args.words_file:
+        with open(args.words_file, 'r') as file:
+            words.extend(line.strip() for line in file)
+
+    counts = WordSearch(words).count(read_input(args.day, test=args.test, name=args.input))
+    for word, count in counts.items():
+        print(f"{word}: {count}")
+
+
+if __name__ == "__main__":
+    main()